@@ -3,13 +3,15 @@ from typing import Optional
 
 from fastapi import FastAPI, Request, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
 from fastapi.exceptions import RequestValidationError
 
 
-from .main import get_db
+from .main import get_db, engine
+from .main.config import Config
+from .main.util.query_counter import QueryCountMiddleware, install_query_counter
 from .main.controller import (
     baby_controller, feeding_controller, sleep_controller, diaper_controller, health_controller,
     doctor_visit_controller, growth_controller, medication_controller, milestone_controller, pumping_controller,
@@ -40,7 +42,9 @@ def create_app():
     app = FastAPI(
         title='BABIES APP',
         version='1.0',
-        description='FastAPI web service for babies and measurements with Google OAuth authentication and co-parenting features'
+        description='FastAPI web service for babies and measurements with Google OAuth authentication and co-parenting features',
+        # orjson encodes datetimes and other response values in C
+        default_response_class=ORJSONResponse
     )
 
     # Add CORS middleware
@@ -52,6 +56,11 @@ def create_app():
         allow_headers=["*"],
     )
 
+    # Count SQL statements per request to catch N+1 regressions during development
+    if Config.SQLALCHEMY_COUNT_QUERIES:
+        install_query_counter(engine)
+        app.add_middleware(QueryCountMiddleware)
+
     # Mount static files BEFORE defining routes
     # This is important for proper resolution
     if Path("pages").exists():
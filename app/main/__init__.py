@@ -1,11 +1,45 @@
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
 from .config import Config
 
+
+def _engine_options(database_uri):
+    """Driver specific engine tuning"""
+    url = make_url(database_uri)
+    options = {}
+    if url.get_backend_name() != 'postgresql':
+        return options
+
+    if Config.SQLALCHEMY_USE_PGBOUNCER:
+        options['poolclass'] = NullPool
+    else:
+        # Check connections on checkout and replace them before server or
+        # load balancer idle timeouts close them
+        options.update({
+            'pool_size': Config.SQLALCHEMY_POOL_SIZE,
+            'max_overflow': Config.SQLALCHEMY_MAX_OVERFLOW,
+            'pool_pre_ping': True,
+            'pool_recycle': Config.SQLALCHEMY_POOL_RECYCLE,
+        })
+
+    if url.get_driver_name() == 'psycopg2':
+        # INSERTs are sent as multi-row VALUES of at most 1000 rows, which is where
+        # PostgreSQL stops getting faster (see util.db.BULK_INSERT_BATCH_SIZE);
+        # executemany UPDATE/DELETE statements are batched as well
+        options.update({
+            'executemany_mode': 'values_plus_batch',
+            'insertmanyvalues_page_size': 1000,
+            'executemany_batch_page_size': 500,
+        })
+    return options
+
+
 # Create SQLAlchemy components
 Base = declarative_base()
-engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
+engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, **_engine_options(Config.SQLALCHEMY_DATABASE_URI))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Dependency to get DB session
@@ -14,4 +48,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -7,6 +7,15 @@ load_dotenv()
 class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = True
+    # Development aid: add an X-Query-Count header to every response
+    SQLALCHEMY_COUNT_QUERIES = os.environ.get('SQLALCHEMY_COUNT_QUERIES', '').lower() in ('1', 'true')
+    # Connection pool per worker process; sync endpoints run in a threadpool of 40
+    # threads, so the pool has to cover that many concurrent sessions
+    SQLALCHEMY_POOL_SIZE = int(os.environ.get('SQLALCHEMY_POOL_SIZE', 20))
+    SQLALCHEMY_MAX_OVERFLOW = int(os.environ.get('SQLALCHEMY_MAX_OVERFLOW', 20))
+    SQLALCHEMY_POOL_RECYCLE = int(os.environ.get('SQLALCHEMY_POOL_RECYCLE', 3600))
+    # Set when connecting through PgBouncer, which does the pooling instead
+    SQLALCHEMY_USE_PGBOUNCER = os.environ.get('SQLALCHEMY_USE_PGBOUNCER', '').lower() in ('1', 'true')
 
 class AWSConfig:
     ACCESS_KEY_ID = os.environ.get('AWS_ACCESS_KEY_ID')
@@ -13,9 +13,8 @@ from app.main.service.user_service import (
     update_user_preference
 )
 from app.main.service.oauth_service import (
-    CLIENT_ID,
-    CLIENT_SECRET,
     REDIRECT_URI,
+    get_client_config,
     get_current_user,
     verify_google_token
 )
@@ -358,7 +357,7 @@ def generate_success_redirect_html(user: User, id_token: str) -> str:
 @router.get("/login")
 async def login_route():
     """Display Google OAuth login page"""
-    auth_url = f"https://accounts.google.com/o/oauth2/auth?response_type=code&client_id={CLIENT_ID}&redirect_uri={REDIRECT_URI}&scope=openid email profile&access_type=offline"
+    auth_url = f"https://accounts.google.com/o/oauth2/auth?response_type=code&client_id={get_client_config()['client_id']}&redirect_uri={REDIRECT_URI}&scope=openid email profile&access_type=offline"
 
     # Return HTML login page instead of JSON
     return HTMLResponse(content=generate_login_html(auth_url))
@@ -367,7 +366,7 @@ async def login_route():
 @router.get("/login/json", response_model=Dict[str, str])
 async def login_json_route():
     """Get Google OAuth login URL as JSON (for API clients)"""
-    auth_url = f"https://accounts.google.com/o/oauth2/auth?response_type=code&client_id={CLIENT_ID}&redirect_uri={REDIRECT_URI}&scope=openid email profile&access_type=offline"
+    auth_url = f"https://accounts.google.com/o/oauth2/auth?response_type=code&client_id={get_client_config()['client_id']}&redirect_uri={REDIRECT_URI}&scope=openid email profile&access_type=offline"
     return {
         "message": "Open this URL in your browser to login with Google",
         "login_url": auth_url
@@ -427,8 +426,8 @@ async def exchange_code_for_token(code: str) -> dict:
     token_url = "https://oauth2.googleapis.com/token"
     token_payload = {
         "code": code,
-        "client_id": CLIENT_ID,
-        "client_secret": CLIENT_SECRET,
+        "client_id": get_client_config()['client_id'],
+        "client_secret": get_client_config()['client_secret'],
         "redirect_uri": REDIRECT_URI,
         "grant_type": "authorization_code"
     }
@@ -17,7 +17,7 @@ from app.main.service.oauth_service import get_current_user
 
 
 @router.get("/", response_model=List[BabyResponse])
-async def list_babies(
+def list_babies(
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
@@ -26,7 +26,7 @@ async def list_babies(
 
 
 @router.post("/", response_model=BabyResponse, status_code=status.HTTP_201_CREATED)
-async def create_baby(
+def create_baby(
         baby: BabyCreate,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
@@ -44,7 +44,7 @@ async def create_baby(
 
 
 @router.get("/{id}", response_model=BabyResponse)
-async def get_baby(
+def get_baby(
         id: int,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
@@ -63,7 +63,7 @@ async def get_baby(
 
 
 @router.put("/{id}", response_model=BabyResponse)
-async def update_baby_info(
+def update_baby_info(
         id: int,
         baby_data: BabyUpdate,
         db: Session = Depends(get_db),
@@ -86,7 +86,7 @@ async def update_baby_info(
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_baby(
+def remove_baby(
         id: int,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
@@ -1,6 +1,6 @@
 from typing import List, Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Header
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.orm import Session
 
@@ -8,11 +8,12 @@ from app.main import get_db
 from app.main.model.user import User
 from app.main.service.coparent_service import (
     send_coparent_invitation,
-    get_pending_invitations,
+    get_pending_invitations_json,
     respond_to_invitation,
     remove_coparent
 )
 from app.main.service.oauth_service import get_current_user
+from app.main.util.cache import cached_json_response
 
 router = APIRouter(
     prefix="/coparent",
@@ -47,7 +48,7 @@ class InvitationActionRequest(BaseModel):
 
 
 @router.post("/invite", response_model=InvitationResponse)
-async def invite_coparent(
+def invite_coparent(
         request: CoParentInviteRequest,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
@@ -72,16 +73,18 @@ async def invite_coparent(
 
 
 @router.get("/invitations", response_model=List[PendingInvitationResponse])
-async def get_my_pending_invitations(
+def get_my_pending_invitations(
+        if_none_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     """Get all pending co-parent invitations for the current user"""
-    return get_pending_invitations(db, current_user.id)
+    body, etag = get_pending_invitations_json(db, current_user.id)
+    return cached_json_response(body, etag, if_none_match)
 
 
 @router.post("/invitations/{invitation_id}", response_model=InvitationResponse)
-async def respond_to_coparent_invitation(
+def respond_to_coparent_invitation(
         invitation_id: int,
         action: InvitationActionRequest,
         db: Session = Depends(get_db),
@@ -100,7 +103,7 @@ async def respond_to_coparent_invitation(
 
 
 @router.delete("/baby/{baby_id}/coparent/", response_model=InvitationResponse)
-async def remove_baby_coparent(
+def remove_baby_coparent(
         baby_id: int,
         coparent: str,
         db: Session = Depends(get_db),
@@ -28,7 +28,7 @@ from app.main.service.dashboard_service import (
     get_checklist_insights
 )
 from app.main.service.oauth_service import get_current_user
-from app.main.service.baby_service import get_all_babies_for_user, get_baby_if_authorized
+from app.main.service.baby_service import get_accessible_baby_ids, get_baby_if_authorized
 
 
 @router.get("/dash", response_model=Dict[str, Any])
@@ -214,8 +214,7 @@ async def get_recent_activity_data(
             )
 
     # Get babies the user has access to
-    all_babies = get_all_babies_for_user(db, current_user.id)
-    baby_ids = [baby.id for baby in all_babies]
+    baby_ids = get_accessible_baby_ids(db, current_user.id)
 
     # Filter to specific baby if requested
     if baby_id:
@@ -252,8 +251,7 @@ async def get_upcoming_event_data(
     """
 
     # Get babies the user has access to
-    all_babies = get_all_babies_for_user(db, current_user.id)
-    baby_ids = [baby.id for baby in all_babies]
+    baby_ids = get_accessible_baby_ids(db, current_user.id)
 
     # Filter to specific baby if requested
     if baby_id:
@@ -405,7 +403,7 @@ async def get_care_metrics_data(
     Timeframe is determined by the CARE_METRICS widget configuration in user preferences.
     To change the timeframe, update the widget's timeframe in user preferences.
     """
-    from app.main.service.baby_service import get_all_babies_for_user, get_baby_if_authorized
+    from app.main.service.baby_service import get_accessible_baby_ids, get_baby_if_authorized
 
     # Get user preferences to determine timeframe for care metrics widget
     preferences = get_or_create_dashboard_preferences(db, current_user.id)
@@ -449,8 +447,7 @@ async def get_care_metrics_data(
             )
 
     # Get babies the user has access to
-    all_babies = get_all_babies_for_user(db, current_user.id)
-    baby_ids = [baby.id for baby in all_babies]
+    baby_ids = get_accessible_baby_ids(db, current_user.id)
 
     # Filter to specific baby if requested
     if baby_id:
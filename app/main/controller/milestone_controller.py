@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import Depends, HTTPException, status, Query
+from fastapi import Depends, HTTPException, status, Query, Header
 from sqlalchemy.orm import Session
 
 from app.main import get_db
@@ -9,12 +9,14 @@ from app.main.model.milestone import router, MilestoneCreate, MilestoneUpdate, M
 from app.main.model.user import User
 from app.main.service.milestone_service import (
     create_milestone,
-    get_milestones_for_baby,
+    bulk_create_milestones,
+    get_milestones_json_for_baby,
     get_milestone,
     update_milestone,
     delete_milestone
 )
 from app.main.service.oauth_service import get_current_user
+from app.main.util.cache import cached_json_response
 
 
 @router.post("/", response_model=MilestoneResponse, status_code=status.HTTP_201_CREATED)
@@ -36,6 +38,25 @@ async def create_milestone_record(
     return result
 
 
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+async def create_milestone_records_bulk(
+        milestones: List[MilestoneCreate],
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """Create several developmental milestone records at once (requires authentication and parent/co-parent relationship)"""
+    result = bulk_create_milestones(db, [milestone.model_dump() for milestone in milestones], current_user.id)
+
+    if result.get('status') == 'fail':
+        status_code = status.HTTP_403_FORBIDDEN if result.get('message') == 'Not authorized to access this baby' else status.HTTP_400_BAD_REQUEST
+        raise HTTPException(
+            status_code=status_code,
+            detail=result.get('message', 'Failed to create milestone records')
+        )
+
+    return result
+
+
 @router.get("/baby/{baby_id}", response_model=List[MilestoneResponse])
 async def get_milestones_by_baby(
         baby_id: int,
@@ -43,11 +64,12 @@ async def get_milestones_by_baby(
         limit: int = Query(100, description="Limit to N records"),
         start_date: Optional[datetime] = Query(None, description="Filter by start date (ISO format)"),
         end_date: Optional[datetime] = Query(None, description="Filter by end date (ISO format)"),
+        if_none_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     """Get developmental milestone records for a baby (requires authentication and parent/co-parent relationship)"""
-    result = get_milestones_for_baby(db, baby_id, current_user.id, skip, limit, start_date, end_date)
+    result = get_milestones_json_for_baby(db, baby_id, current_user.id, skip, limit, start_date, end_date)
 
     if isinstance(result, dict) and result.get('status') == 'fail':
         status_code = status.HTTP_403_FORBIDDEN if result.get('message') == 'Not authorized to access this baby' else status.HTTP_404_NOT_FOUND
@@ -56,7 +78,8 @@ async def get_milestones_by_baby(
             detail=result.get('message', 'Failed to retrieve milestone records')
         )
 
-    return result
+    body, etag = result
+    return cached_json_response(body, etag, if_none_match)
 
 
 @router.get("/{milestone_id}", response_model=MilestoneResponse)
@@ -10,6 +10,7 @@ from app.main.model import Notification
 from app.main.model.user import User
 from app.main.service.notification_service import (
     get_user_notifications,
+    get_unread_notification_count,
     mark_notification_read,
     mark_all_notifications_read, remove_sent_notification
 )
@@ -33,6 +34,9 @@ class NotificationActionResponse(BaseModel):
     status: str
     message: str
 
+class UnreadCountResponse(BaseModel):
+    unread_count: int
+
 
 @router.get("/", response_model=List[NotificationResponse])
 async def get_my_notifications(
@@ -44,6 +48,15 @@ async def get_my_notifications(
     return get_user_notifications(db, current_user.id, unread_only)
 
 
+@router.get("/unread-count", response_model=UnreadCountResponse)
+async def get_my_unread_count(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the number of unread notifications for the current user"""
+    return get_unread_notification_count(db, current_user.id)
+
+
 @router.put("/{notification_id}/read", response_model=NotificationActionResponse)
 async def mark_as_read(
     notification_id: int,
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from fastapi import Depends, HTTPException, status, File, UploadFile, Form
+from fastapi import Depends, HTTPException, status, File, UploadFile, Form, Header
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -13,11 +13,12 @@ from app.main.service.oauth_service import get_current_user
 from app.main.service.photo_service import (
     upload_baby_profile_picture,
     upload_baby_photo,
-    get_baby_photos,
+    get_baby_photos_json,
     get_photos_for_milestone,
     link_photo_to_milestone,
     delete_photo
 )
+from app.main.util.cache import cached_json_response
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def upload_photo(
@@ -68,11 +69,12 @@ async def upload_photo(
 async def get_photos_for_baby(
         baby_id: int,
         photo_type: Optional[PhotoType] = None,
+        if_none_match: Optional[str] = Header(None),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     """Get photos for a baby with optional type filtering (requires authentication and parent/co-parent relationship)"""
-    result = get_baby_photos(db, baby_id, current_user.id, photo_type)
+    result = get_baby_photos_json(db, baby_id, current_user.id, photo_type)
 
     if isinstance(result, dict) and result.get('status') == 'fail':
         status_code = status.HTTP_403_FORBIDDEN if result.get(
@@ -82,7 +84,8 @@ async def get_photos_for_baby(
             detail=result.get('message', 'Failed to retrieve photos')
         )
 
-    return result
+    body, etag = result
+    return cached_json_response(body, etag, if_none_match)
 
 
 @router.get("/milestone/{milestone_id}")
@@ -1,14 +1,15 @@
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import Depends, HTTPException, status, Query
+from fastapi import Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 
 from app.main import get_db
-from app.main.model.pumping import router, PumpingCreate, PumpingUpdate, PumpingResponse
+from app.main.model.pumping import router, PumpingCreate, PumpingUpdate, PumpingResponse, PumpingResponseList
 from app.main.model.user import User
 from app.main.service.pumping_service import (
     create_pumping,
+    bulk_create_pumpings,
     get_pumpings_for_user,
     get_pumping,
     update_pumping,
@@ -35,6 +36,16 @@ async def create_pumping_record(
     return result
 
 
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+async def create_pumping_records_bulk(
+        pumpings: List[PumpingCreate],
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """Create several pumping session records at once (requires authentication)"""
+    return bulk_create_pumpings(db, [pumping.model_dump() for pumping in pumpings], current_user.id)
+
+
 @router.get("/", response_model=List[PumpingResponse])
 async def get_pumping_sessions(
         skip: int = Query(0, description="Skip N records"),
@@ -46,7 +57,9 @@ async def get_pumping_sessions(
 ):
     """Get pumping session records for the current user"""
     result = get_pumpings_for_user(db, current_user.id, skip, limit, start_date, end_date)
-    return result
+    # Validate and serialize the whole page in one pass
+    rows = PumpingResponseList.validate_python(result, from_attributes=True)
+    return Response(content=PumpingResponseList.dump_json(rows), media_type="application/json")
 
 
 @router.get("/{pumping_id}", response_model=PumpingResponse)
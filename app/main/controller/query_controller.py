@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, status, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.main import get_db
@@ -67,8 +68,8 @@ async def process_query(
                 detail=result.error or "Query processing failed"
             )
 
-        # Return structured response
-        return QueryResponse(
+        # Built from trusted internal data, so skip constructor validation
+        response = QueryResponse.model_construct(
             success=True,
             data=result.data,
             metadata={
@@ -83,6 +84,8 @@ async def process_query(
                 "thinking_process": result.tool_selection.thinking_process if request.include_thinking else None
             }
         )
+        # Encode straight to JSON bytes instead of dumping to Python objects first
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except HTTPException:
         raise
@@ -108,7 +111,7 @@ async def debug_query_processing(
     """
 
     try:
-        available_tools = get_active_tools(db)
+        available_tools = await run_in_threadpool(get_active_tools, db)
 
         # Run tool selection only
         tool_selection_result = await claude_service.select_tools_for_query(
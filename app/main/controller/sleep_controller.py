@@ -1,11 +1,11 @@
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-from fastapi import Depends, HTTPException, status, Query
+from fastapi import Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 
 from app.main import get_db
-from app.main.model.sleep import router, SleepCreate, SleepUpdate, SleepResponse
+from app.main.model.sleep import router, SleepCreate, SleepUpdate, SleepResponse, SleepResponseList
 from app.main.model.user import User
 from app.main.service.sleep_service import (
     create_sleep,
@@ -56,7 +56,9 @@ async def get_sleeps_by_baby(
             detail=result.get('message', 'Failed to retrieve sleep records')
         )
 
-    return result
+    # Validate and serialize the whole page in one pass
+    rows = SleepResponseList.validate_python(result, from_attributes=True)
+    return Response(content=SleepResponseList.dump_json(rows), media_type="application/json")
 
 
 @router.get("/{sleep_id}", response_model=SleepResponse)
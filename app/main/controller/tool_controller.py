@@ -4,12 +4,12 @@ Handles HTTP requests for tool management and execution.
 """
 from typing import List
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 
 from app.main import get_db
 from app.main.model.tool import ToolResponse, ToolCreate, router, ToolUpdate, ToolExecutionRequest, \
-    ToolExecutionResponse
+    ToolExecutionResponse, ToolResponseList
 from app.main.model.user import User
 from app.main.service.oauth_service import get_current_user, is_admin_user
 from app.main.service.tool_service import (
@@ -51,7 +51,9 @@ async def list_tools(
     and analysis.
     """
     tools = get_all_tools(db)
-    return tools
+    # Validate and serialize the whole list in one pass
+    rows = ToolResponseList.validate_python(tools, from_attributes=True)
+    return Response(content=ToolResponseList.dump_json(rows), media_type="application/json")
 
 
 @router.get("/{tool_id}", response_model=ToolResponse)
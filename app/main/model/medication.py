@@ -1,13 +1,14 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter
-from pydantic import BaseModel
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.main import Base
+from app.main.util.db import utcnow
 
 
 class MedicationRoute(str, Enum):
@@ -29,6 +30,11 @@ class MedicationBase(BaseModel):
     reason: Optional[str] = None
     notes: Optional[str] = None
 
+    model_config = {
+        "from_attributes": True,
+        "frozen": True
+    }
+
 
 class MedicationCreate(MedicationBase):
     baby_id: int
@@ -45,8 +51,9 @@ class MedicationResponse(MedicationBase):
     recorded_by: int
     caregiver_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+
+# Built once so list endpoints validate and serialize the whole page in one call
+MedicationResponseList = TypeAdapter(List[MedicationResponse])
 
 
 router = APIRouter(
@@ -58,9 +65,12 @@ router = APIRouter(
 
 class Medication(Base):
     __tablename__ = "medication"
+    __table_args__ = (
+        Index('ix_medication_baby_time', 'baby_id', 'time_given'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
     name = Column(String(100), nullable=False)
     dosage = Column(Float, nullable=False)
     dosage_unit = Column(String(20), nullable=False)
@@ -74,7 +84,8 @@ class Medication(Base):
     recorded_by = Column(Integer, ForeignKey('users.id'), nullable=False)
 
     # Relationships
-    baby = relationship("Baby", back_populates="medications")
+    baby = relationship("Baby", back_populates="medications", lazy='raise')
+    caregiver = relationship("User", lazy='raise')
 
     def __repr__(self):
         return f"<Medication {self.name} for baby {self.baby_id} at {self.time_given}>"
\ No newline at end of file
@@ -1,13 +1,14 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter
-from pydantic import BaseModel
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.main import Base
+from app.main.util.db import utcnow
 
 
 class MilestoneCategory(str, Enum):
@@ -26,6 +27,11 @@ class MilestoneBase(BaseModel):
     description: Optional[str] = None
     notes: Optional[str] = None
 
+    model_config = {
+        "from_attributes": True,
+        "frozen": True
+    }
+
 
 class MilestoneCreate(MilestoneBase):
     baby_id: int
@@ -42,8 +48,9 @@ class MilestoneResponse(MilestoneBase):
     recorded_by: int
     caregiver_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+
+# Built once so list endpoints validate and serialize the whole page in one call
+MilestoneResponseList = TypeAdapter(List[MilestoneResponse])
 
 
 router = APIRouter(
@@ -55,13 +62,16 @@ router = APIRouter(
 
 class Milestone(Base):
     __tablename__ = "milestone"
+    __table_args__ = (
+        Index('ix_milestone_baby_achieved', 'baby_id', 'achieved_date'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
     title = Column(String(100), nullable=False)
     category = Column(String(50), nullable=False)
     achieved_date = Column(DateTime, nullable=False)
-    description = Column(String(500), nullable=True)
+    description = Column(Text, nullable=True)
     notes = Column(Text, nullable=True)
     photo_url = Column(String(500), nullable=True)
 
@@ -70,8 +80,10 @@ class Milestone(Base):
     recorded_by = Column(Integer, ForeignKey('users.id'), nullable=False)
 
     # Relationships
-    baby = relationship("Baby", back_populates="milestones")
-    photos = relationship("Photo", back_populates="milestone", cascade="all, delete-orphan")  # New relationship
+    baby = relationship("Baby", back_populates="milestones", lazy='raise')
+    caregiver = relationship("User", lazy='raise')
+    # Photos outlive their milestone; the database unlinks them through ON DELETE SET NULL
+    photos = relationship("Photo", back_populates="milestone", passive_deletes=True, lazy='raise')
 
     def __repr__(self):
         return f"<Milestone '{self.title}' for baby {self.baby_id}>"
\ No newline at end of file
@@ -1,8 +1,10 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Table, Boolean
+from enum import IntEnum
+
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Table, Boolean, Index, SmallInteger, text
 from sqlalchemy.orm import relationship
-from datetime import datetime
 
 from app.main import Base
+from app.main.util.db import utcnow
 
 # Association table for co-parent relationship
 baby_coparent = Table(
@@ -12,21 +14,36 @@ baby_coparent = Table(
     Column('baby_id', Integer, ForeignKey('baby.id'), primary_key=True)
 )
 
+class InviteStatus(IntEnum):
+    PENDING = 0
+    ACCEPTED = 1
+    REJECTED = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
 # Table for co-parent invitations
 class CoParentInvitation(Base):
     __tablename__ = 'coparent_invitation'
+    __table_args__ = (
+        # Only pending invitations are looked up, so only they are indexed; the
+        # baby column lets the duplicate invitation check use the index alone
+        Index('ix_coparent_pending', 'invitee_id', 'baby_id', postgresql_where=text('status = 0')),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
     inviter_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     invitee_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     baby_id = Column(Integer, ForeignKey('baby.id'), nullable=False)
-    status = Column(String(20), default='pending')  # pending, accepted, rejected
+    status = Column(SmallInteger, nullable=False, default=InviteStatus.PENDING, server_default='0')  # InviteStatus
     
     # Relationships
-    inviter = relationship("User", foreign_keys=[inviter_id], back_populates="sent_invitations")
-    invitee = relationship("User", foreign_keys=[invitee_id], back_populates="received_invitations")
-    baby = relationship("Baby", back_populates="invitations")
+    inviter = relationship("User", foreign_keys=[inviter_id], back_populates="sent_invitations", lazy='raise')
+    invitee = relationship("User", foreign_keys=[invitee_id], back_populates="received_invitations", lazy='raise')
+    baby = relationship("Baby", back_populates="invitations", lazy='raise')
 
     notifications = relationship("Notification",
                                  foreign_keys="Notification.reference_id",
@@ -40,9 +57,12 @@ class CoParentInvitation(Base):
 # Notification table for user alerts
 class Notification(Base):
     __tablename__ = 'notification'
+    __table_args__ = (
+        Index('ix_notification_user_unread', 'user_id', 'is_read'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     message = Column(String(500), nullable=False)
     type = Column(String(50), nullable=False)  # coparent_invitation, baby_update, etc.
@@ -50,7 +70,7 @@ class Notification(Base):
     is_read = Column(Boolean, default=False)
     
     # Relationship
-    user = relationship("User", back_populates="notifications")
+    user = relationship("User", back_populates="notifications", lazy='raise')
 
     def __repr__(self):
         return f"<Notification '{self.type}' for user '{self.user_id}'>"
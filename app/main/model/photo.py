@@ -4,10 +4,11 @@ from typing import Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 
 from app.main import Base
+from app.main.util.db import EnumCode, utcnow
 
 
 class PhotoType(str, Enum):
@@ -17,12 +18,26 @@ class PhotoType(str, Enum):
     OTHER = "other"
 
 
+# One character stored per row in photo.photo_type
+PHOTO_TYPE_CODES = {
+    PhotoType.PROFILE: 'P',
+    PhotoType.MILESTONE: 'M',
+    PhotoType.GROWTH: 'G',
+    PhotoType.OTHER: 'O',
+}
+
+
 class PhotoBase(BaseModel):
     photo_type: PhotoType
     description: Optional[str] = None
     date_taken: Optional[datetime] = None
     milestone_id: Optional[int] = None
 
+    model_config = {
+        "from_attributes": True,
+        "frozen": True
+    }
+
 
 class PhotoCreate(PhotoBase):
     baby_id: int
@@ -41,9 +56,6 @@ class PhotoResponse(PhotoBase):
     recorded_by: int
     caregiver_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 router = APIRouter(
     prefix="/photos",
@@ -54,22 +66,27 @@ router = APIRouter(
 
 class Photo(Base):
     __tablename__ = "photo"
+    __table_args__ = (
+        Index('ix_photo_baby_date', 'baby_id', 'date_taken'),
+        CheckConstraint("photo_type IN ('P', 'M', 'G', 'O')", name='ck_photo_photo_type'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    photo_type = Column(SQLEnum(PhotoType), nullable=False)
-    description = Column(String(500), nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    photo_type = Column(EnumCode(PhotoType, PHOTO_TYPE_CODES), nullable=False)
+    description = Column(Text, nullable=True)
     date_taken = Column(DateTime, nullable=True)
     s3_key = Column(String(500), nullable=False)
 
     # Foreign keys
     baby_id = Column(Integer, ForeignKey('baby.id'), nullable=False)
-    milestone_id = Column(Integer, ForeignKey('milestone.id'), nullable=True)
+    milestone_id = Column(Integer, ForeignKey('milestone.id', ondelete='SET NULL'), nullable=True)
     recorded_by = Column(Integer, ForeignKey('users.id'), nullable=False)
 
     # Relationships
-    baby = relationship("Baby", back_populates="photos")
-    milestone = relationship("Milestone", back_populates="photos")
+    baby = relationship("Baby", back_populates="photos", lazy='raise')
+    milestone = relationship("Milestone", back_populates="photos", lazy='raise')
+    caregiver = relationship("User", lazy='raise')
 
     def __repr__(self):
         return f"<Photo {self.photo_type} for baby {self.baby_id}>"
\ No newline at end of file
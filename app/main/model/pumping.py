@@ -1,12 +1,14 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter
-from pydantic import BaseModel
-from sqlalchemy import Column, Integer, DateTime, Float, ForeignKey, Text
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Column, Integer, DateTime, Float, ForeignKey, Text, Index, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 from app.main import Base
+from app.main.util.db import utcnow
 
 
 class PumpingBase(BaseModel):
@@ -18,6 +20,11 @@ class PumpingBase(BaseModel):
     total_amount: Optional[float] = None  # in ml
     notes: Optional[str] = None
 
+    model_config = {
+        "from_attributes": True,
+        "frozen": True
+    }
+
 
 class PumpingCreate(PumpingBase):
     pass
@@ -32,8 +39,9 @@ class PumpingResponse(PumpingBase):
     created_at: datetime
     user_id: int
 
-    class Config:
-        from_attributes = True
+
+# Built once so list endpoints validate and serialize the whole page in one call
+PumpingResponseList = TypeAdapter(List[PumpingResponse])
 
 
 router = APIRouter(
@@ -45,9 +53,12 @@ router = APIRouter(
 
 class Pumping(Base):
     __tablename__ = "pumping"
+    __table_args__ = (
+        Index('ix_pumping_user_start', 'user_id', 'start_time'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=True)
     duration = Column(Integer, nullable=True)  # in minutes
@@ -60,7 +71,19 @@ class Pumping(Base):
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
 
     # Relationships
-    user = relationship("User", back_populates="pumping_sessions")
+    user = relationship("User", back_populates="pumping_sessions", lazy='raise')
+
+    @hybrid_property
+    def total_volume(self) -> float:
+        """Recorded total in ml, falling back to the sum of both sides"""
+        if self.total_amount is not None:
+            return self.total_amount
+        return (self.left_amount or 0) + (self.right_amount or 0)
+
+    @total_volume.expression
+    def total_volume(cls):
+        # Same rule in SQL, so filters, ORDER BY and SUM can run in the database
+        return func.coalesce(cls.total_amount, func.coalesce(cls.left_amount, 0) + func.coalesce(cls.right_amount, 0))
 
     def __repr__(self):
         return f"<Pumping session for user {self.user_id} at {self.start_time}>"
\ No newline at end of file
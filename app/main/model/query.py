@@ -25,6 +25,10 @@ class QueryType(str, Enum):
     COMPARATIVE_ANALYSIS = "comparative_analysis"
 
 
+# Lets the classification Claude returns be resolved with a dict lookup and a default
+QUERY_TYPES_BY_VALUE: Dict[str, QueryType] = {query_type.value: query_type for query_type in QueryType}
+
+
 class ProcessingPhase(str, Enum):
     """Phases of query processing"""
     INITIALIZATION = "initialization"
@@ -73,6 +77,7 @@ class ToolSelectionInfo(BaseModel):
     relevance_score: float = Field(..., ge=0.0, le=1.0)
     selection_reason: str
     estimated_execution_time_ms: Optional[int] = None
+    parameters: Optional[Dict[str, Any]] = None  # Filled in by the selection call when it can
 
     model_config = {"from_attributes": True}
 
@@ -92,7 +97,7 @@ class ToolExecutionInfo(BaseModel):
 
 
 # Dataclass models for internal processing
-@dataclass
+@dataclass(slots=True)
 class ToolSelectionResult:
     """Result from Claude's tool selection process"""
     selected_tools: List[Tool]
@@ -125,7 +130,7 @@ class ToolSelectionResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryProcessingResult:
     """Complete result from query processing"""
     success: bool
@@ -187,6 +192,7 @@ class StreamingEvent(BaseModel):
     progress_percentage: Optional[float] = Field(None, ge=0.0, le=100.0)
 
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -209,7 +215,7 @@ class ActivityAnalysisResponse(BaseModel):
     time_range: str
     total_activities: int
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 class SleepAnalysisResponse(BaseModel):
@@ -220,7 +226,7 @@ class SleepAnalysisResponse(BaseModel):
     recommendations: Optional[List[str]] = None
     time_range: str
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 class CareMetricsResponse(BaseModel):
@@ -230,7 +236,7 @@ class CareMetricsResponse(BaseModel):
     participation_metrics: Dict[str, Any]
     time_range: str
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 # Error response models
@@ -243,7 +249,7 @@ class ProcessingError(BaseModel):
     fallback_available: bool = False
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 class ValidationError(BaseModel):
@@ -253,7 +259,7 @@ class ValidationError(BaseModel):
     invalid_value: Any
     expected_format: Optional[str] = None
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 # Configuration models
@@ -262,10 +268,12 @@ class ClaudeAPIConfig(BaseModel):
     model: str = "claude-sonnet-4-20250514"
     max_tokens: int = 20000
     temperature: float = 1
+    selection_temperature: float = 0.0  # Tool selection is classification; used when thinking is off
     enable_thinking: bool = True
     thinking_budget_tokens: int = 19999
     max_tools_per_query: int = 3
     selection_confidence_threshold: float = 0.6
+    extraction_max_tokens: int = 256  # Parameter replies are a small JSON object
 
     model_config = {"from_attributes": True}
 
@@ -279,7 +287,7 @@ class QueryProcessingConfig(BaseModel):
     max_concurrent_executions: int = 5
     execution_timeout_seconds: int = 30
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 # Utility models for complex operations
@@ -290,7 +298,7 @@ class BulkQueryRequest(BaseModel):
     parallel_processing: bool = True
     max_concurrent: int = Field(3, ge=1, le=10)
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 class BulkQueryResponse(BaseModel):
@@ -303,7 +311,7 @@ class BulkQueryResponse(BaseModel):
     processing_time_ms: float
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 class QueryAnalytics(BaseModel):
@@ -317,7 +325,7 @@ class QueryAnalytics(BaseModel):
     period_start: datetime
     period_end: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
 
 
 router = APIRouter(
@@ -1,10 +1,10 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter
-from pydantic import BaseModel
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
 from app.main import Base
@@ -66,6 +66,10 @@ class SleepResponse(SleepBase):
         from_attributes = True
 
 
+# Built once so list endpoints validate and serialize the whole page in one call
+SleepResponseList = TypeAdapter(List[SleepResponse])
+
+
 router = APIRouter(
     prefix="/sleep",
     tags=["sleep"],
@@ -75,6 +79,9 @@ router = APIRouter(
 
 class Sleep(Base):
     __tablename__ = "sleep"
+    __table_args__ = (
+        Index('ix_sleep_baby_start', 'baby_id', 'start_time'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
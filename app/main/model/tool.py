@@ -5,11 +5,11 @@ structured data to Claude API for processing user requests.
 """
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any, Annotated
+from typing import Optional, Dict, Any, Annotated, List
 
 from fastapi import APIRouter
-from pydantic import BaseModel, Field
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, Text, ForeignKey, Enum as SQLEnum
+from pydantic import BaseModel, Field, TypeAdapter
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, Text, ForeignKey, Index, Uuid, text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
 from app.main import Base
@@ -76,6 +76,10 @@ class ToolResponse(ToolBase):
         from_attributes = True
 
 
+# Built once so list endpoints validate and serialize the whole page in one call
+ToolResponseList = TypeAdapter(List[ToolResponse])
+
+
 class ToolExecutionRequest(BaseModel):
     """Schema for tool execution request"""
     tool_id: int
@@ -114,6 +118,12 @@ class Tool(Base):
     that can be used by the Claude API.
     """
     __tablename__ = "tool"
+    # Created with fillfactor 80 (see migrations) so the usage counter updates
+    # on every execution stay heap-only and skip the indexes
+    __table_args__ = (
+        # Covers get_active_tools, which runs on every query
+        Index('ix_tool_active_type', 'status', 'tool_type', postgresql_where=text('is_active')),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -122,7 +132,7 @@ class Tool(Base):
     # Tool identification
     name = Column(String(100), nullable=False, unique=True)
 
-    tool_type = Column(SQLEnum(ToolType, native_enum=False, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    tool_type = Column(SQLEnum(ToolType, name='tool_type_enum', values_callable=lambda obj: [e.value for e in obj]), nullable=False)
     description = Column(Text, nullable=False)
     version = Column(String(20), nullable=False, default="1.0.0")
 
@@ -130,8 +140,7 @@ class Tool(Base):
     capabilities = Column(JSON, nullable=False, default=dict)  # What the tool can do
     configuration = Column(JSON, nullable=False, default=dict)  # Tool-specific config
 
-    # Use native_enum=False for status
-    status = Column(SQLEnum(ToolStatus, native_enum=False, values_callable=lambda obj: [e.value for e in obj]), nullable=False, default=ToolStatus.ACTIVE)
+    status = Column(SQLEnum(ToolStatus, name='tool_status_enum', values_callable=lambda obj: [e.value for e in obj]), nullable=False, default=ToolStatus.ACTIVE)
     is_active = Column(Boolean, default=True)
 
     # Usage tracking
@@ -151,9 +160,16 @@ class ToolExecution(Base):
     This helps in monitoring tool usage and performance.
     """
     __tablename__ = "tool_execution"
+    # Fillfactor 80 as well, for the status/result update after each run
+    __table_args__ = (
+        Index('ix_toolexec_tool_created', 'tool_id', 'created_at'),
+        # Rows arrive in created_at order, so a BRIN index serves time ranges at a fraction of the size
+        Index('ix_toolexec_created_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    execution_id = Column(String(50), nullable=False, unique=True)  # UUID for tracking
+    execution_id = Column(Uuid, nullable=False, unique=True)  # UUID for tracking
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Execution details
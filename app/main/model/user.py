@@ -63,15 +63,19 @@ class User(Base):
     is_admin = Column(Boolean, default=False)
     skip_onboarding = Column(Boolean, default=False, nullable=False)
     google_id = Column(String(255), unique=True, nullable=True, index=True)
+    # Maintained by the notification_unread_count trigger on the notification table
+    unread_notifications = Column(Integer, nullable=False, default=0, server_default='0')
 
     # Relationships
-    babies = relationship("Baby", back_populates="parent")
-    pumping_sessions = relationship("Pumping", back_populates="user", cascade="all, delete-orphan")
-    coparented_babies = relationship("Baby", secondary="baby_coparent", back_populates="coparents")
-    sent_invitations = relationship("CoParentInvitation", foreign_keys="CoParentInvitation.inviter_id", back_populates="inviter")
-    received_invitations = relationship("CoParentInvitation", foreign_keys="CoParentInvitation.invitee_id", back_populates="invitee")
-    notifications = relationship("Notification", back_populates="user")
-    dashboard_preference = relationship("DashboardPreference", back_populates="user", uselist=False)
+    # The current user is loaded on every request, so none of these load implicitly;
+    # query the related rows directly or use selectinload
+    babies = relationship("Baby", back_populates="parent", lazy='raise_on_sql')
+    pumping_sessions = relationship("Pumping", back_populates="user", cascade="all, delete-orphan", lazy='raise_on_sql')
+    coparented_babies = relationship("Baby", secondary="baby_coparent", back_populates="coparents", lazy='raise_on_sql')
+    sent_invitations = relationship("CoParentInvitation", foreign_keys="CoParentInvitation.inviter_id", back_populates="inviter", lazy='raise_on_sql')
+    received_invitations = relationship("CoParentInvitation", foreign_keys="CoParentInvitation.invitee_id", back_populates="invitee", lazy='raise_on_sql')
+    notifications = relationship("Notification", back_populates="user", lazy='raise_on_sql')
+    dashboard_preference = relationship("DashboardPreference", back_populates="user", uselist=False, lazy='raise_on_sql')
 
     def __repr__(self):
         return f"<User '{self.email}'>"
\ No newline at end of file
@@ -1,9 +1,54 @@
+import io
 import logging
+import threading
+import time
+
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from fastapi.concurrency import run_in_threadpool
 
 from app.main.config import AWSConfig
 
+# Shared by every upload and presign so the connection pool stays warm
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
+# Files larger than this are sent as a multipart upload with parts in parallel
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_TRANSFER_CONFIG = TransferConfig(multipart_threshold=MULTIPART_THRESHOLD, max_concurrency=10)
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+# Presigned URLs are reused for up to half their lifetime, so a caller always
+# gets at least half the expiration it asked for
+MAX_PRESIGNED_URLS = 4096
+_presigned_urls = {}
+_presigned_urls_lock = threading.Lock()
+
+
+def _get_s3_client():
+    """Return the process-wide S3 client, creating it on first use"""
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = boto3.client(
+                    's3',
+                    region_name=AWSConfig.REGION,
+                    aws_access_key_id=AWSConfig.ACCESS_KEY_ID,
+                    aws_secret_access_key=AWSConfig.SECRET_ACCESS_KEY,
+                    # Use a custom endpoint URL that includes the region
+                    endpoint_url=f"https://s3.{AWSConfig.REGION}.amazonaws.com",
+                    config=S3_CLIENT_CONFIG
+                )
+    return _s3_client
+
 
 def upload_file(file_content, path):
     """
@@ -14,23 +59,29 @@ def upload_file(file_content, path):
     :return: True if file was uploaded, else False
     """
     try:
-        s3_resource = boto3.resource(
-            's3',
-            aws_access_key_id=AWSConfig.ACCESS_KEY_ID,
-            aws_secret_access_key=AWSConfig.SECRET_ACCESS_KEY,
-            region_name=AWSConfig.REGION,
-            # Use a custom endpoint URL that includes the region
-            endpoint_url=f"https://s3.{AWSConfig.REGION}.amazonaws.com"
-        )
-
-        bucket = s3_resource.Bucket(AWSConfig.S3_BUCKET)
-        bucket.Object(path).put(Body=file_content)
+        s3_client = _get_s3_client()
+        if len(file_content) > MULTIPART_THRESHOLD:
+            s3_client.upload_fileobj(io.BytesIO(file_content), AWSConfig.S3_BUCKET, path,
+                                     Config=S3_TRANSFER_CONFIG)
+        else:
+            s3_client.put_object(Bucket=AWSConfig.S3_BUCKET, Key=path, Body=file_content)
         return True
-    except ClientError as e:
+    except (ClientError, S3UploadFailedError) as e:
         logging.error(f"Error uploading file to S3: {e}")
         return False
 
 
+async def upload_file_async(file_content, path):
+    """
+    Upload a file to an S3 bucket from a worker thread, keeping the event loop free
+
+    :param file_content: Content of the file as bytes
+    :param path: S3 object path
+    :return: True if file was uploaded, else False
+    """
+    return await run_in_threadpool(upload_file, file_content, path)
+
+
 def create_presigned_url(object_name, expiration=3600):
     """
     Generate a presigned URL to share an S3 object
@@ -39,17 +90,14 @@ def create_presigned_url(object_name, expiration=3600):
     :param expiration: Time in seconds for the presigned URL to remain valid
     :return: Presigned URL as string. If error, returns None.
     """
-    try:
-        s3_client = boto3.client(
-            's3',
-            region_name=AWSConfig.REGION,
-            aws_access_key_id=AWSConfig.ACCESS_KEY_ID,
-            aws_secret_access_key=AWSConfig.SECRET_ACCESS_KEY,
-            # Use a custom endpoint URL that includes the region
-            endpoint_url=f"https://s3.{AWSConfig.REGION}.amazonaws.com"
-        )
+    key = (object_name, expiration)
+    now = time.monotonic()
+    entry = _presigned_urls.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
 
-        response = s3_client.generate_presigned_url(
+    try:
+        response = _get_s3_client().generate_presigned_url(
             'get_object',
             Params={
                 'Bucket': AWSConfig.S3_BUCKET,
@@ -57,7 +105,15 @@ def create_presigned_url(object_name, expiration=3600):
             },
             ExpiresIn=expiration
         )
-        return response
     except ClientError as e:
         logging.error(f"Error creating presigned URL: {e}")
-        return None
\ No newline at end of file
+        return None
+
+    with _presigned_urls_lock:
+        if len(_presigned_urls) >= MAX_PRESIGNED_URLS:
+            for stale_key in [k for k, v in _presigned_urls.items() if v[0] <= now]:
+                del _presigned_urls[stale_key]
+            if len(_presigned_urls) >= MAX_PRESIGNED_URLS:
+                _presigned_urls.clear()
+        _presigned_urls[key] = (now + expiration / 2, response)
+    return response
@@ -2,18 +2,21 @@ from datetime import datetime
 from typing import Dict, List, Any, Union
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, or_
+from sqlalchemy.orm import Session, selectinload
 from starlette import status
 
 from app.main.model.baby import Baby
+from app.main.model.parent_child_schema import baby_coparent
 from app.main.model.user import User
 from app.main.service.aws_service import create_presigned_url
+from app.main.util.cache import invalidate_baby_cache
 
 
 def save_new_baby(db: Session, data: Dict[str, Any], current_user_id: int) -> Union[Baby, Dict[str, str]]:
     """Create a new baby record with parent relationship"""
     # Check if baby with same name exists for this user (assuming this would be a duplicate)
-    existing_baby = db.query(Baby).filter(
+    existing_baby = db.query(Baby.id).filter(
         Baby.fullname == data['fullname'],
         Baby.birthdate == data.get('birthdate'),
         Baby.parent_id == current_user_id
@@ -64,18 +67,11 @@ def update_baby(db: Session, id: int, data: Dict[str, Any], current_user_id: int
 
 def get_all_babies_for_user(db: Session, user_id: int) -> List[Baby]:
     """Get all babies for a specific user (as parent or co-parent)"""
-    # Get babies where user is the primary parent
-    parent_babies = db.query(Baby).filter(Baby.parent_id == user_id).all()
-
-    # Get babies where user is a co-parent
-    user = db.query(User).filter(User.id == user_id).first()
-    coparent_babies = user.coparented_babies if user else []
-
-    # Combine both lists (avoiding duplicates)
-    all_babies = list(parent_babies)
-    for baby in coparent_babies:
-        if baby not in all_babies:
-            all_babies.append(baby)
+    # Babies where the user is the primary parent or a co-parent, with the
+    # parents and co-parents the response lists loaded one query each
+    all_babies = db.query(Baby).options(selectinload(Baby.parent), selectinload(Baby.coparents)).filter(
+        or_(Baby.parent_id == user_id, Baby.coparents.any(User.id == user_id))
+    ).order_by(Baby.id).all()
 
     # Add presigned URLs for pictures
     for baby in all_babies:
@@ -85,9 +81,17 @@ def get_all_babies_for_user(db: Session, user_id: int) -> List[Baby]:
     return all_babies
 
 
+def get_accessible_baby_ids(db: Session, user_id: int) -> List[int]:
+    """Get the IDs of all babies a user can access (as parent or co-parent)"""
+    return [baby_id for baby_id, in db.query(Baby.id).filter(
+        or_(Baby.parent_id == user_id, Baby.coparents.any(User.id == user_id))
+    ).order_by(Baby.id)]
+
+
 def get_baby_if_authorized(db: Session, baby_id: int, user_id: int) -> Union[Baby, Dict[str, str]]:
     """Get a baby by ID if the user is authorized (parent or co-parent)"""
-    baby = db.query(Baby).filter(Baby.id == baby_id).first()
+    # Repeat checks within a request are served from the identity map
+    baby = db.get(Baby, baby_id)
 
     if not baby:
         return {
@@ -95,21 +99,17 @@ def get_baby_if_authorized(db: Session, baby_id: int, user_id: int) -> Union[Bab
             'message': 'Baby not found',
         }
 
-    # Check if user is the primary parent
-    if baby.parent_id == user_id:
+    # The primary parent needs no query; a co-parent is checked with an EXISTS,
+    # so the co-parent collection is never loaded
+    if baby.parent_id == user_id or db.query(exists().where(
+        baby_coparent.c.baby_id == baby_id,
+        baby_coparent.c.user_id == user_id
+    )).scalar():
         # Add presigned URL for picture if exists
         if baby.picture:
             baby.picture_url = create_presigned_url(baby.picture)
         return baby
 
-    # Check if user is a co-parent
-    for coparent in baby.coparents:
-        if coparent.id == user_id:
-            # Add presigned URL for picture if exists
-            if baby.picture:
-                baby.picture_url = create_presigned_url(baby.picture)
-            return baby
-
     # User is not authorized
     return {
         'status': 'fail',
@@ -123,7 +123,7 @@ def get_a_baby(db: Session, id: int, current_user_id: int) -> Union[Baby, Dict[s
 
 def delete_baby(db: Session, id: int, current_user_id: int) -> Union[Dict[str, str], None]:
     """Delete a baby by ID if the user is the primary parent"""
-    baby = db.query(Baby).filter(Baby.id == id).first()
+    baby = db.get(Baby, id)
 
     if not baby:
         return {
@@ -140,6 +140,7 @@ def delete_baby(db: Session, id: int, current_user_id: int) -> Union[Dict[str, s
 
     db.delete(baby)
     db.commit()
+    invalidate_baby_cache(id)
     return {'status': 'DELETED'}
 
 def _get_baby_ids(db, user_id, baby_id):
@@ -154,5 +155,4 @@ def _get_baby_ids(db, user_id, baby_id):
         return [baby_id]
     else:
         # Get all babies the user has access to
-        babies = get_all_babies_for_user(db, user_id)
-        return [baby.id for baby in babies]
\ No newline at end of file
+        return get_accessible_baby_ids(db, user_id)
\ No newline at end of file
@@ -3,22 +3,188 @@ Claude API integration service.
 Handles communication with Claude API for tool selection and execution.
 Prepared for future SSE/WebSocket implementation.
 """
-import json
+import asyncio
 import logging
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Type, Union
+from typing import Callable, Dict, List, Any, Optional, Type, Union
 
-from anthropic import Anthropic
+import orjson
+from anthropic import AsyncAnthropic
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session, InstrumentedAttribute
 
 from app.main.model.query import ClaudeAPIConfig, QueryProcessingResult, ToolSelectionResult, ToolExecutionInfo, \
-    ExecutionStatus, ToolSelectionInfo, QueryType
+    ExecutionStatus, ToolSelectionInfo, QueryType, QUERY_TYPES_BY_VALUE
 from app.main.model.tool import Tool, ToolType
 from app.main.service.tool_service import execute_tool, get_active_tools
 
 logger = logging.getLogger(__name__)
 
+# Keywords for the fallback tool selection used when Claude's answer can't be parsed
+FALLBACK_TOOL_KEYWORDS = {
+    ToolType.ACTIVITY_ANALYZER: (
+        'activity', 'activities', 'recent', 'what did', 'what happened',
+        'today', 'summary', 'daily', 'routine', 'schedule', 'events'
+    ),
+    ToolType.SLEEP_PATTERN_ANALYZER: (
+        'sleep', 'sleeping', 'nap', 'rest', 'bedtime', 'night',
+        'tired', 'wake', 'dream', 'slumber'
+    ),
+    ToolType.FEEDING_TRACKER: (
+        'feed', 'feeding', 'eat', 'eating', 'meal', 'food',
+        'nutrition', 'bottle', 'breast', 'formula'
+    ),
+    ToolType.HEALTH_MONITOR: (
+        'health', 'sick', 'fever', 'temperature', 'symptom',
+        'doctor', 'medical', 'medication', 'wellness'
+    ),
+    ToolType.GROWTH_TRACKER: (
+        'growth', 'growing', 'weight', 'height', 'size',
+        'development', 'bigger', 'heavier', 'taller'
+    ),
+    ToolType.MILESTONE_TRACKER: (
+        'milestone', 'achievement', 'development', 'progress',
+        'learning', 'skill', 'ability', 'new'
+    ),
+    ToolType.CARE_METRICS_ANALYZER: (
+        'care', 'caregiver', 'who', 'participation', 'sharing',
+        'helped', 'taking care', 'babysitter', 'parent'
+    ),
+    ToolType.SCHEDULE_ASSISTANT: (
+        'schedule', 'upcoming', 'events', 'appointments', 'when',
+        'next', 'calendar', 'plan', 'reminder'
+    ),
+}
+
+
+# Descriptions for each tool type, shown to Claude for tool selection
+TOOL_TYPE_INFO = {
+    ToolType.ACTIVITY_ANALYZER: {
+        "description": "Analyzes baby activities, recent events, and daily patterns",
+        "use_cases": "Questions about what the baby did, recent activities, daily summaries",
+        "sample_queries": ["What did my baby do today?", "Show recent activities", "Baby's daily summary"],
+        "data_types": ["activities", "events", "routines"]
+    },
+    ToolType.SLEEP_PATTERN_ANALYZER: {
+        "description": "Analyzes sleep patterns, nap schedules, and sleep quality metrics",
+        "use_cases": "Sleep-related questions, nap analysis, sleep quality assessment",
+        "sample_queries": ["How did my baby sleep?", "Sleep patterns this week", "Nap schedule analysis"],
+        "data_types": ["sleep_sessions", "nap_times", "sleep_quality"]
+    },
+    ToolType.FEEDING_TRACKER: {
+        "description": "Tracks feeding sessions, nutrition intake, and feeding patterns",
+        "use_cases": "Feeding-related questions, nutrition analysis, feeding schedule",
+        "sample_queries": ["When did my baby last eat?", "Feeding patterns", "Nutrition summary"],
+        "data_types": ["feeding_sessions", "nutrition_data", "feeding_schedule"]
+    },
+    ToolType.HEALTH_MONITOR: {
+        "description": "Monitors health metrics, symptoms, and medical information",
+        "use_cases": "Health-related questions, symptom tracking, medical appointments",
+        "sample_queries": ["How is my baby's health?", "Recent symptoms", "Medical updates"],
+        "data_types": ["health_metrics", "symptoms", "medical_records"]
+    },
+    ToolType.GROWTH_TRACKER: {
+        "description": "Tracks physical growth, weight, height, and development metrics",
+        "use_cases": "Growth-related questions, development tracking, milestone progress",
+        "sample_queries": ["How is my baby growing?", "Weight progression", "Growth milestones"],
+        "data_types": ["growth_measurements", "weight_data", "height_data"]
+    },
+    ToolType.MILESTONE_TRACKER: {
+        "description": "Tracks developmental milestones and achievements",
+        "use_cases": "Milestone questions, development progress, achievement tracking",
+        "sample_queries": ["What milestones has my baby reached?", "Development progress",
+                           "Recent achievements"],
+        "data_types": ["milestones", "achievements", "development_stages"]
+    },
+    ToolType.CARE_METRICS_ANALYZER: {
+        "description": "Analyzes caregiving metrics, caregiver participation, and care distribution",
+        "use_cases": "Questions about who provided care, caregiver statistics, care sharing",
+        "sample_queries": ["Who took care of the baby?", "Caregiver participation",
+                           "Care sharing analysis"],
+        "data_types": ["caregiver_activities", "care_sessions", "participation_metrics"]
+    },
+    ToolType.SCHEDULE_ASSISTANT: {
+        "description": "Manages schedules, upcoming events, and appointment planning",
+        "use_cases": "Scheduling questions, upcoming events, appointment management",
+        "sample_queries": ["What's scheduled next?", "Upcoming appointments", "Schedule planning"],
+        "data_types": ["schedules", "appointments", "events"]
+    }
+}
+
+# Added to extracted parameters for reporting; tools don't read them
+EXTRACTION_METADATA_KEYS = frozenset({"extraction_method", "extraction_timestamp"})
+
+# Tool selection prompt prefixes kept per set of active tools
+MAX_SELECTION_INSTRUCTIONS = 16
+
+# Shared by every formatted result, so it must not be modified
+RESULT_METADATA = {
+    "api_version": "v2.0",
+    "processing_method": "claude_ai_enhanced",
+    "schema_version": "2025.1"
+}
+
+
+
+def _json_value_end(text: str, start: int) -> int:
+    """Return the index just past the JSON object or array opening at start, or -1 if it isn't closed yet"""
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in '{[':
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return -1
+
+
+def _load_first_json_object(response_content: str) -> Optional[Dict[str, Any]]:
+    """Parse the first complete JSON object in a response, ignoring any text around it"""
+    start = response_content.find('{')
+    if start == -1:
+        return None
+
+    # Usually the reply holds a single object, which orjson parses without the Python scan
+    end = response_content.rfind('}') + 1
+    try:
+        return orjson.loads(response_content[start:end])
+    except orjson.JSONDecodeError:
+        pass
+
+    end = _json_value_end(response_content, start)
+    if end == -1:
+        return None
+    return orjson.loads(response_content[start:end])
+
+
+def _selected_tools_so_far(response_content: str) -> Optional[List[Dict[str, Any]]]:
+    """Parse the selected_tools array from a partial tool selection response once it is complete"""
+    key = response_content.find('"selected_tools"')
+    if key == -1:
+        return None
+    start = response_content.find('[', key)
+    if start == -1:
+        return None
+    end = _json_value_end(response_content, start)
+    if end == -1:
+        return None
+    return orjson.loads(response_content[start:end])
+
 class ClaudeAPIService:
     """
     Service for integrating with Claude API.
@@ -30,8 +196,9 @@ class ClaudeAPIService:
             api_key: str,
             config: Optional[ClaudeAPIConfig] = None
     ):
-        self.client = Anthropic(api_key=api_key)
+        self.client = AsyncAnthropic(api_key=api_key)
         self.config = config or ClaudeAPIConfig()
+        self._selection_instructions: OrderedDict[tuple, str] = OrderedDict()
 
     async def process_query_with_tools(
             self,
@@ -45,7 +212,6 @@ class ClaudeAPIService:
         """
         Enhanced query processing using structured schemas.
         """
-        global parameters, processing_metadata
         start_time = time.time()
 
         try:
@@ -60,9 +226,9 @@ class ClaudeAPIService:
                 "phases": {}
             }
 
-            # Phase 1: Get available tools
+            # Phase 1: Get available tools, off the event loop since a cache miss queries the database
             phase_start = time.time()
-            available_tools = get_active_tools(db)
+            available_tools = await run_in_threadpool(get_active_tools, db)
             processing_metadata["phases"]["tool_discovery"] = {
                 "duration_ms": (time.time() - phase_start) * 1000,
                 "tools_found": len(available_tools)
@@ -86,9 +252,23 @@ class ClaudeAPIService:
 
             # Phase 2: Tool selection using Claude
             phase_start = time.time()
-            tool_selection_result = await self.select_tools_for_query(
-                db, query, available_tools, baby_id, include_thinking
-            )
+            # Start resolving parameters as soon as the selected tools are known
+            early_parameters = {}
+
+            def start_parameters(tools: List[Type[Tool]], tool_info: List[ToolSelectionInfo]) -> None:
+                for tool, info in zip(tools, tool_info):
+                    early_parameters[tool.id] = asyncio.ensure_future(
+                        self._tool_parameters(query, tool, info, baby_id)
+                    )
+
+            try:
+                tool_selection_result = await self.select_tools_for_query(
+                    db, query, available_tools, baby_id, include_thinking, start_parameters
+                )
+            except BaseException:
+                for task in early_parameters.values():
+                    task.cancel()
+                raise
             processing_metadata["phases"]["tool_selection"] = {
                 "duration_ms": (time.time() - phase_start) * 1000,
                 "tools_selected": len(tool_selection_result.selected_tools),
@@ -97,6 +277,8 @@ class ClaudeAPIService:
             }
 
             if not tool_selection_result.selected_tools:
+                for task in early_parameters.values():
+                    task.cancel()
                 return QueryProcessingResult(
                     success=False,
                     data={},
@@ -110,19 +292,35 @@ class ClaudeAPIService:
             phase_start = time.time()
             tool_results = []
             execution_info = []
-
-            for i, tool in enumerate(tool_selection_result.selected_tools):
+            successful_executions = 0
+
+            # Resolve parameters for all selected tools at once, since any the selection
+            # call didn't supply take a separate Claude call; the tools then run one by
+            # one on this session, which cannot be shared between threads
+            extracted_parameters = await asyncio.gather(*(
+                early_parameters.pop(tool.id, None) or self._tool_parameters(query, tool, info, baby_id)
+                for tool, info in zip(tool_selection_result.selected_tools, tool_selection_result.tool_info)
+            ), return_exceptions=True)
+            for task in early_parameters.values():
+                task.cancel()
+
+            for tool, tool_parameters in zip(tool_selection_result.selected_tools, extracted_parameters):
                 execution_start = time.time()
+                parameters = {} if isinstance(tool_parameters, Exception) else tool_parameters
 
                 try:
-                    # Extract parameters using Claude
-                    parameters = await self._extract_parameters_from_query(
-                        query, tool.tool_type, baby_id
-                    )
+                    if isinstance(tool_parameters, Exception):
+                        raise tool_parameters
+
+                    # How the parameters were extracted is reported in parameters_used but kept
+                    # out of the tool's input, so identical requests record identical parameters
+                    tool_input = {key: value for key, value in parameters.items()
+                                  if key not in EXTRACTION_METADATA_KEYS}
 
-                    # Execute tool
-                    result = execute_tool(db, tool.id, user_id, parameters, baby_id)
+                    # Execute tool in the threadpool so its queries don't block the event loop
+                    result = await run_in_threadpool(execute_tool, db, tool.id, user_id, tool_input, baby_id)
                     tool_results.append(result)
+                    data = result.get("data")
 
                     # Track execution info
                     execution_info.append(ToolExecutionInfo(
@@ -131,9 +329,10 @@ class ClaudeAPIService:
                         tool_type=tool.tool_type,
                         status=ExecutionStatus.SUCCESS,
                         execution_time_ms=(time.time() - execution_start) * 1000,
-                        result_count=len(result.get("data", [])) if isinstance(result.get("data"), list) else 1,
+                        result_count=len(data) if isinstance(data, list) else 1,
                         parameters_used=parameters
                     ))
+                    successful_executions += 1
 
                 except Exception as e:
                     logger.error(f"Tool execution failed for {tool.name}: {str(e)}")
@@ -162,8 +361,8 @@ class ClaudeAPIService:
             processing_metadata["phases"]["tool_execution"] = {
                 "duration_ms": (time.time() - phase_start) * 1000,
                 "total_executions": len(execution_info),
-                "successful_executions": len([e for e in execution_info if e.status == ExecutionStatus.SUCCESS]),
-                "failed_executions": len([e for e in execution_info if e.status == ExecutionStatus.FAILED])
+                "successful_executions": successful_executions,
+                "failed_executions": len(execution_info) - successful_executions
             }
 
             # Phase 4: Result synthesis
@@ -178,8 +377,8 @@ class ClaudeAPIService:
             # Create execution summary
             execution_summary = {
                 "total_tools": len(tool_selection_result.selected_tools),
-                "successful_executions": len([e for e in execution_info if e.status == ExecutionStatus.SUCCESS]),
-                "failed_executions": len([e for e in execution_info if e.status == ExecutionStatus.FAILED]),
+                "successful_executions": successful_executions,
+                "failed_executions": len(execution_info) - successful_executions,
                 "execution_details": [info.__dict__ for info in execution_info],
                 "total_execution_time_ms": sum(info.execution_time_ms or 0 for info in execution_info)
             }
@@ -225,15 +424,18 @@ class ClaudeAPIService:
             query: str,
             available_tools: Optional[List[Type[Tool]]] = None,
             baby_id: Optional[int] = None,
-            include_thinking: bool = False
+            include_thinking: bool = False,
+            on_tools_selected: Optional[Callable[[List[Type[Tool]], List[ToolSelectionInfo]], None]] = None
     ) -> ToolSelectionResult:
         """
         Enhanced tool selection using structured schemas.
+        on_tools_selected is called as soon as the streamed response has named its
+        tools, while Claude is still writing the overall reasoning.
         """
         selection_start = time.time()
 
         if not available_tools:
-            available_tools = get_active_tools(db)
+            available_tools = await run_in_threadpool(get_active_tools, db)
 
         if not available_tools:
             return ToolSelectionResult(
@@ -245,11 +447,8 @@ class ClaudeAPIService:
                 selection_time_ms=(time.time() - selection_start) * 1000
             )
 
-        # Prepare tool descriptions for Claude
-        tool_descriptions = self._prepare_tool_descriptions(available_tools)
-
         # Create comprehensive prompt for tool selection
-        prompt = self._create_tool_selection_prompt(query, tool_descriptions, baby_id)
+        prompt = self._create_tool_selection_prompt(query, available_tools, baby_id)
 
         try:
             # Use Claude with thinking based on parameter
@@ -257,7 +456,8 @@ class ClaudeAPIService:
             params = {
                 "model": self.config.model,
                 "max_tokens": self.config.max_tokens,
-                "temperature": self.config.temperature,
+                # Extended thinking only accepts the default temperature
+                "temperature": self.config.temperature if include_thinking else self.config.selection_temperature,
                 "messages": [{
                     "role": "user",
                     "content": prompt
@@ -271,7 +471,21 @@ class ClaudeAPIService:
                     "budget_tokens": self.config.thinking_budget_tokens
                 }
 
-            response = self.client.messages.create(**params)
+            async with self.client.messages.stream(**params) as stream:
+                if on_tools_selected is not None:
+                    streamed_content = ""
+                    async for text in stream.text_stream:
+                        streamed_content += text
+                        if ']' not in text:
+                            continue
+                        try:
+                            selected_tools_data = _selected_tools_so_far(streamed_content)
+                        except ValueError:
+                            break
+                        if selected_tools_data is not None:
+                            on_tools_selected(*self._build_tool_selection(selected_tools_data, available_tools))
+                            break
+                response = await stream.get_final_message()
 
             # Extract thinking process and response content properly
             thinking_process = None
@@ -342,6 +556,39 @@ class ClaudeAPIService:
                 selection_time_ms=selection_time
             )
 
+    def _build_tool_selection(
+            self,
+            selected_tools_data: List[Dict[str, Any]],
+            available_tools: List[Type[Tool]]
+    ) -> tuple[list[Type[Tool]], list[ToolSelectionInfo]]:
+        """Match the tools Claude selected to the available tools"""
+        selected_tools = []
+        tool_info = []
+        tool_dict = {tool.name: tool for tool in available_tools}
+
+        for selected_tool_data in selected_tools_data:
+            tool_name = selected_tool_data.get("tool_name")
+            if tool_name in tool_dict:
+                tool = tool_dict[tool_name]
+                selected_tools.append(tool)
+
+                # The sleep analyzer's parameters need their own prompt
+                parameters = selected_tool_data.get("parameters")
+                if not isinstance(parameters, dict) or tool.tool_type == ToolType.SLEEP_PATTERN_ANALYZER:
+                    parameters = None
+
+                # Create detailed tool info
+                tool_info.append(ToolSelectionInfo(
+                    tool_id=tool.id,
+                    tool_name=tool.name,
+                    tool_type=tool.tool_type,
+                    relevance_score=selected_tool_data.get("relevance_score", 0.8),
+                    selection_reason=selected_tool_data.get("reason", "Selected for query relevance"),
+                    parameters=parameters
+                ))
+
+        return selected_tools, tool_info
+
     def _parse_tool_selection_response(
             self,
             response_content: str,
@@ -352,34 +599,14 @@ class ClaudeAPIService:
 
         try:
             # Extract JSON from response
-            json_start = response_content.find('{')
-            json_end = response_content.rfind('}') + 1
-
-            if json_start == -1 or json_end == 0:
+            parsed_response = _load_first_json_object(response_content)
+            if parsed_response is None:
                 raise ValueError("No JSON found in response")
 
-            json_str = response_content[json_start:json_end]
-            parsed_response = json.loads(json_str)
-
             # Extract selected tools and create detailed info
-            selected_tools = []
-            tool_info = []
-            tool_dict = {tool.name: tool for tool in available_tools}
-
-            for selected_tool_data in parsed_response.get("selected_tools", []):
-                tool_name = selected_tool_data.get("tool_name")
-                if tool_name in tool_dict:
-                    tool = tool_dict[tool_name]
-                    selected_tools.append(tool)
-
-                    # Create detailed tool info
-                    tool_info.append(ToolSelectionInfo(
-                        tool_id=tool.id,
-                        tool_name=tool.name,
-                        tool_type=tool.tool_type,
-                        relevance_score=selected_tool_data.get("relevance_score", 0.8),
-                        selection_reason=selected_tool_data.get("reason", "Selected for query relevance")
-                    ))
+            selected_tools, tool_info = self._build_tool_selection(
+                parsed_response.get("selected_tools", []), available_tools
+            )
 
             reasoning = parsed_response.get("overall_reasoning", "Tool selection completed")
             confidence = float(parsed_response.get("overall_confidence", 0.8))
@@ -388,10 +615,8 @@ class ClaudeAPIService:
             query_classification = None
             classification_str = parsed_response.get("query_classification")
             if classification_str:
-                try:
-                    query_classification = QueryType(classification_str.lower())
-                except ValueError:
-                    query_classification = QueryType.GENERAL_QUESTION
+                query_classification = QUERY_TYPES_BY_VALUE.get(classification_str.lower(),
+                                                                QueryType.GENERAL_QUESTION)
 
             return selected_tools, tool_info, reasoning, confidence, query_classification
 
@@ -401,9 +626,10 @@ class ClaudeAPIService:
             # Fallback parsing - look for tool names in text
             selected_tools = []
             tool_info = []
+            response_lower = response_content.lower()
 
             for tool in available_tools:
-                if tool.name.lower() in response_content.lower():
+                if tool.name.lower() in response_lower:
                     selected_tools.append(tool)
                     tool_info.append(ToolSelectionInfo(
                         tool_id=tool.id,
@@ -438,63 +664,9 @@ class ClaudeAPIService:
         """Prepare detailed tool descriptions for Claude"""
         descriptions = {}
 
-        # descriptions for each tool type
-        tool_type_info = {
-            ToolType.ACTIVITY_ANALYZER: {
-                "description": "Analyzes baby activities, recent events, and daily patterns",
-                "use_cases": "Questions about what the baby did, recent activities, daily summaries",
-                "sample_queries": ["What did my baby do today?", "Show recent activities", "Baby's daily summary"],
-                "data_types": ["activities", "events", "routines"]
-            },
-            ToolType.SLEEP_PATTERN_ANALYZER: {
-                "description": "Analyzes sleep patterns, nap schedules, and sleep quality metrics",
-                "use_cases": "Sleep-related questions, nap analysis, sleep quality assessment",
-                "sample_queries": ["How did my baby sleep?", "Sleep patterns this week", "Nap schedule analysis"],
-                "data_types": ["sleep_sessions", "nap_times", "sleep_quality"]
-            },
-            ToolType.FEEDING_TRACKER: {
-                "description": "Tracks feeding sessions, nutrition intake, and feeding patterns",
-                "use_cases": "Feeding-related questions, nutrition analysis, feeding schedule",
-                "sample_queries": ["When did my baby last eat?", "Feeding patterns", "Nutrition summary"],
-                "data_types": ["feeding_sessions", "nutrition_data", "feeding_schedule"]
-            },
-            ToolType.HEALTH_MONITOR: {
-                "description": "Monitors health metrics, symptoms, and medical information",
-                "use_cases": "Health-related questions, symptom tracking, medical appointments",
-                "sample_queries": ["How is my baby's health?", "Recent symptoms", "Medical updates"],
-                "data_types": ["health_metrics", "symptoms", "medical_records"]
-            },
-            ToolType.GROWTH_TRACKER: {
-                "description": "Tracks physical growth, weight, height, and development metrics",
-                "use_cases": "Growth-related questions, development tracking, milestone progress",
-                "sample_queries": ["How is my baby growing?", "Weight progression", "Growth milestones"],
-                "data_types": ["growth_measurements", "weight_data", "height_data"]
-            },
-            ToolType.MILESTONE_TRACKER: {
-                "description": "Tracks developmental milestones and achievements",
-                "use_cases": "Milestone questions, development progress, achievement tracking",
-                "sample_queries": ["What milestones has my baby reached?", "Development progress",
-                                   "Recent achievements"],
-                "data_types": ["milestones", "achievements", "development_stages"]
-            },
-            ToolType.CARE_METRICS_ANALYZER: {
-                "description": "Analyzes caregiving metrics, caregiver participation, and care distribution",
-                "use_cases": "Questions about who provided care, caregiver statistics, care sharing",
-                "sample_queries": ["Who took care of the baby?", "Caregiver participation",
-                                   "Care sharing analysis"],
-                "data_types": ["caregiver_activities", "care_sessions", "participation_metrics"]
-            },
-            ToolType.SCHEDULE_ASSISTANT: {
-                "description": "Manages schedules, upcoming events, and appointment planning",
-                "use_cases": "Scheduling questions, upcoming events, appointment management",
-                "sample_queries": ["What's scheduled next?", "Upcoming appointments", "Schedule planning"],
-                "data_types": ["schedules", "appointments", "events"]
-            }
-        }
-
         for tool in tools:
-            if tool.tool_type in tool_type_info:
-                info = tool_type_info[tool.tool_type]
+            if tool.tool_type in TOOL_TYPE_INFO:
+                info = TOOL_TYPE_INFO[tool.tool_type]
                 descriptions[tool.name] = {
                     "id": str(tool.id),
                     "type": tool.tool_type.value,
@@ -512,19 +684,36 @@ class ClaudeAPIService:
     def _create_tool_selection_prompt(
             self,
             query: str,
-            tool_descriptions: Dict[str, Dict[str, str]],
+            tools: List[Type[Tool]],
             baby_id: Optional[int]
-    ) -> str:
+    ) -> List[Dict[str, Any]]:
         """Create a comprehensive prompt for Claude to select appropriate tools"""
-
-        tools_json = json.dumps(tool_descriptions, indent=2)
         baby_context = f"for baby ID {baby_id}" if baby_id else "for any baby in the user's account"
 
-        return f"""You are an intelligent assistant for a baby care application. Your task is to analyze user queries and select the most appropriate tools to answer them.
-
-USER QUERY: "{query}"
+        request = f"""USER QUERY: "{query}"
 CONTEXT: This query is {baby_context}
 
+Analyze the query and provide your tool selection in the specified JSON format."""
+
+        # Everything but the query is the same on every request, so it goes first
+        # and is marked for prompt caching
+        return [
+            {"type": "text", "text": self._get_selection_instructions(tools), "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": request}
+        ]
+
+    def _get_selection_instructions(self, tools: List[Type[Tool]]) -> str:
+        """Get the static part of the tool selection prompt, building it once per set of tools"""
+        key = tuple((tool.id, tool.version, tool.updated_at) for tool in tools)
+        instructions = self._selection_instructions.get(key)
+        if instructions is not None:
+            self._selection_instructions.move_to_end(key)
+            return instructions
+
+        # Compact JSON reads the same to Claude and costs fewer input tokens than an indented dump
+        tools_json = orjson.dumps(self._prepare_tool_descriptions(tools)).decode()
+        instructions = f"""You are an intelligent assistant for a baby care application. Your task is to analyze user queries and select the most appropriate tools to answer them.
+
 AVAILABLE TOOLS:
 {tools_json}
 
@@ -534,8 +723,9 @@ INSTRUCTIONS:
 3. Select 1-{self.config.max_tools_per_query} most relevant tools (avoid over-selection)
 4. Provide detailed reasoning for each selection
 5. Assign relevance scores (0.0-1.0) for each selected tool
-6. Classify the overall query type
-7. Assign overall confidence score (0.0-1.0)
+6. Extract the parameters each selected tool needs from the query (not needed for sleep_pattern_analyzer)
+7. Classify the overall query type
+8. Assign overall confidence score (0.0-1.0)
 
 RESPONSE FORMAT:
 Provide your response as a JSON object with this exact structure:
@@ -545,7 +735,11 @@ Provide your response as a JSON object with this exact structure:
             "tool_name": "exact_tool_name_from_available_tools",
             "tool_type": "tool_type_value",
             "relevance_score": 0.0-1.0,
-            "reason": "detailed explanation for selecting this tool"
+            "reason": "detailed explanation for selecting this tool",
+            "parameters": {{
+                "timeframe": "integer of detected time range by days or null",
+                "include_details": "true or false to include details"
+            }}
         }}
     ],
     "overall_reasoning": "comprehensive explanation of your selection logic and how tools work together",
@@ -560,9 +754,29 @@ SELECTION GUIDELINES:
 - Avoid selecting too many tools unless truly necessary for comprehensive analysis
 - If no tools are perfectly relevant, select the closest match
 - Consider complementary tools for complex queries (e.g., sleep + activities for behavioral analysis)
-- Use confidence threshold: only select tools with relevance_score >= {self.config.selection_confidence_threshold}
+- Use confidence threshold: only select tools with relevance_score >= {self.config.selection_confidence_threshold}"""
 
-Analyze the query and provide your tool selection in the specified JSON format."""
+        self._selection_instructions[key] = instructions
+        if len(self._selection_instructions) > MAX_SELECTION_INSTRUCTIONS:
+            self._selection_instructions.popitem(last=False)
+        return instructions
+
+    async def _tool_parameters(
+            self,
+            query: str,
+            tool: Type[Tool],
+            info: ToolSelectionInfo,
+            baby_id: Optional[int]
+    ) -> Dict[str, Any]:
+        """Use the parameters from tool selection, asking Claude separately only when there are none"""
+        if info.parameters is None:
+            return await self._extract_parameters_from_query(query, tool.tool_type, baby_id)
+
+        parameters = dict(info.parameters)
+        parameters["baby_id"] = baby_id
+        parameters["extraction_method"] = "claude_selection"
+        parameters["extraction_timestamp"] = time.time()
+        return parameters
 
     async def _extract_parameters_from_query(
             self,
@@ -675,22 +889,18 @@ Provide response as JSON:
 }}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.config.model,
-                max_tokens=1000,
-                temperature=0.1,
+                max_tokens=self.config.extraction_max_tokens,
+                temperature=0.0,
                 messages=[{"role": "user", "content": parameter_extraction_prompt}]
             )
 
             response_content = response.content[0].text if response.content else "{}"
 
             # Parse JSON response
-            json_start = response_content.find('{')
-            json_end = response_content.rfind('}') + 1
-
-            if json_start != -1 and json_end > json_start:
-                json_str = response_content[json_start:json_end]
-                parameters = json.loads(json_str)
+            parameters = _load_first_json_object(response_content)
+            if parameters is not None:
 
                 # Add baby_id and execution metadata
                 parameters["baby_id"] = baby_id
@@ -776,46 +986,13 @@ Provide response as JSON:
         selected_tools = []
         query_lower = query.lower()
 
-        # Enhanced keyword-based tool selection
-        tool_keywords = {
-            ToolType.ACTIVITY_ANALYZER: [
-                'activity', 'activities', 'recent', 'what did', 'what happened',
-                'today', 'summary', 'daily', 'routine', 'schedule', 'events'
-            ],
-            ToolType.SLEEP_PATTERN_ANALYZER: [
-                'sleep', 'sleeping', 'nap', 'rest', 'bedtime', 'night',
-                'tired', 'wake', 'dream', 'slumber'
-            ],
-            ToolType.FEEDING_TRACKER: [
-                'feed', 'feeding', 'eat', 'eating', 'meal', 'food',
-                'nutrition', 'bottle', 'breast', 'formula'
-            ],
-            ToolType.HEALTH_MONITOR: [
-                'health', 'sick', 'fever', 'temperature', 'symptom',
-                'doctor', 'medical', 'medication', 'wellness'
-            ],
-            ToolType.GROWTH_TRACKER: [
-                'growth', 'growing', 'weight', 'height', 'size',
-                'development', 'bigger', 'heavier', 'taller'
-            ],
-            ToolType.MILESTONE_TRACKER: [
-                'milestone', 'achievement', 'development', 'progress',
-                'learning', 'skill', 'ability', 'new'
-            ],
-            ToolType.CARE_METRICS_ANALYZER: [
-                'care', 'caregiver', 'who', 'participation', 'sharing',
-                'helped', 'taking care', 'babysitter', 'parent'
-            ],
-            ToolType.SCHEDULE_ASSISTANT: [
-                'schedule', 'upcoming', 'events', 'appointments', 'when',
-                'next', 'calendar', 'plan', 'reminder'
-            ]
-        }
-
-        # Score tools based on keyword matches
+        # Score tools based on keyword matches, noting the default tool on the same pass
         tool_scores = {}
+        activity_tool = None
         for tool in available_tools:
-            tool_type_keywords = tool_keywords.get(tool.tool_type, [])
+            if activity_tool is None and tool.tool_type == ToolType.ACTIVITY_ANALYZER:
+                activity_tool = tool
+            tool_type_keywords = FALLBACK_TOOL_KEYWORDS.get(tool.tool_type, ())
             score = sum(1 for keyword in tool_type_keywords if keyword in query_lower)
             if score > 0:
                 tool_scores[tool] = score
@@ -828,11 +1005,7 @@ Provide response as JSON:
 
         # Default to activity analyzer if no specific match
         if not selected_tools and available_tools:
-            activity_tool = next(
-                (t for t in available_tools if t.tool_type == ToolType.ACTIVITY_ANALYZER),
-                available_tools[0]
-            )
-            selected_tools.append(activity_tool)
+            selected_tools.append(activity_tool or available_tools[0])
 
         return selected_tools
 
@@ -843,6 +1016,15 @@ Provide response as JSON:
             selection_reasoning: str
     ) -> Dict[str, Any]:
         """Enhanced result formatting with structured data"""
+        # Tally the summary in one pass over the results
+        successful_results = 0
+        data_points = 0
+        for result in tool_results:
+            if result.get("status") == "error":
+                continue
+            successful_results += 1
+            data = result.get("data")
+            data_points += len(data) if isinstance(data, list) else 1
 
         return {
             "query_context": {
@@ -854,16 +1036,9 @@ Provide response as JSON:
             "results": tool_results,
             "summary": {
                 "total_tools_executed": len(tool_results),
-                "successful_results": len([r for r in tool_results if r.get("status") != "error"]),
-                "has_errors": any(r.get("status") == "error" for r in tool_results),
-                "data_points": sum(
-                    len(r.get("data", [])) if isinstance(r.get("data"), list) else 1
-                    for r in tool_results if r.get("status") != "error"
-                )
+                "successful_results": successful_results,
+                "has_errors": successful_results < len(tool_results),
+                "data_points": data_points
             },
-            "metadata": {
-                "api_version": "v2.0",
-                "processing_method": "claude_ai_enhanced",
-                "schema_version": "2025.1"
-            }
+            "metadata": RESULT_METADATA
         }
\ No newline at end of file
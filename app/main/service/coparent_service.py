@@ -1,198 +1,243 @@
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+import orjson
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, exists, insert, literal, select, update
 
 from app.main.model.baby import Baby
 from app.main.model.user import User
 from app.main.service.baby_service import get_baby_if_authorized
 from app.main.service.notification_service import create_notification
+from app.main.util.cache import INVITATION_CACHE_TTL, cached_json, invalidate_user_cache, user_cache_key
 
 # Import CoParentInvitation from the updated schema
-from app.main.model.parent_child_schema import CoParentInvitation, Notification
+from app.main.model.parent_child_schema import CoParentInvitation, InviteStatus, Notification, baby_coparent
+
 
 def send_coparent_invitation(db: Session, baby_id: int, invitee_email: str, inviter_id: int) -> Union[CoParentInvitation, Dict[str, str]]:
     """Send a co-parent invitation to another user"""
-    # Check if the baby exists and the inviter is the parent
-    baby = db.query(Baby).filter(Baby.id == baby_id).first()
-    if not baby:
+    # Look up the baby and the invitee together with whether they already co-parent
+    # this baby or have an invitation pending for it, in one round trip
+    row = db.query(
+        Baby.fullname,
+        User,
+        exists().where(
+            baby_coparent.c.baby_id == baby_id,
+            baby_coparent.c.user_id == User.id
+        ),
+        exists().where(
+            CoParentInvitation.baby_id == baby_id,
+            CoParentInvitation.invitee_id == User.id,
+            CoParentInvitation.status == InviteStatus.PENDING
+        )
+    ).select_from(Baby).outerjoin(User, User.email == invitee_email).filter(Baby.id == baby_id).first()
+
+    # Check if the baby exists
+    if not row:
         return {
             'status': 'fail',
             'message': 'Baby not found',
         }
+    baby_name, invitee, is_coparent, has_pending_invitation = row
 
     # Check if the invitee exists
-    invitee = db.query(User).filter(User.email == invitee_email).first()
-    if not invitee:
+    if invitee is None:
         return {
             'status': 'fail',
             'message': 'The invited user does not exist',
         }
 
     # Check if invitee is already a co-parent
-    for coparent in baby.coparents:
-        if coparent.id == invitee.id:
-            return {
-                'status': 'fail',
-                'message': 'User is already a co-parent for this baby',
-            }
+    if is_coparent:
+        return {
+            'status': 'fail',
+            'message': 'User is already a co-parent for this baby',
+        }
 
     # Check if there's already a pending invitation
-    existing_invitation = db.query(CoParentInvitation).filter(
-        and_(
-            CoParentInvitation.baby_id == baby_id,
-            CoParentInvitation.invitee_id == invitee.id,
-            CoParentInvitation.status == 'pending'
-        )
-    ).first()
-
-    if existing_invitation:
+    if has_pending_invitation:
         return {
             'status': 'fail',
             'message': 'There is already a pending invitation for this user',
         }
 
-    # Create the invitation
+    # Build the notification while the inviter (already loaded for this request)
+    # is in the session; the commit below expires it
+    invitee_id = invitee.id
+    inviter = db.get(User, inviter_id)
+    message = f"{inviter.name} has invited you to be a co-parent for {baby_name}"
+
+    # Create the invitation with a plain INSERT, getting the generated values back
+    # from the same statement instead of going through the unit of work
+    invitation_id, created_at = db.execute(
+        insert(CoParentInvitation).values(
+            inviter_id=inviter_id,
+            invitee_id=invitee_id,
+            baby_id=baby_id,
+            status=InviteStatus.PENDING
+        ).returning(CoParentInvitation.id, CoParentInvitation.created_at)
+    ).one()
+
+    # Create a notification for the invitee in the same transaction
+    notification = create_notification(db, invitee_id, message, "coparent_invitation", invitation_id, commit=False)
+    notification_id = notification.id
+    db.commit()
+
+    invalidate_user_cache(invitee_id, 'invitations')
+
+    # Detached copy of the new row for the caller
     invitation = CoParentInvitation(
-        created_at=datetime.utcnow(),
+        id=invitation_id,
+        created_at=created_at,
         inviter_id=inviter_id,
-        invitee_id=invitee.id,
+        invitee_id=invitee_id,
         baby_id=baby_id,
-        status='pending'
+        status=InviteStatus.PENDING
     )
-    db.add(invitation)
-    db.commit()
-    db.refresh(invitation)
+    invitation.notification_id = notification_id
+    return invitation
 
-    # Create a notification for the invitee
-    inviter = db.query(User).filter(User.id == inviter_id).first()
-    message = f"{inviter.name} has invited you to be a co-parent for {baby.fullname}"
-    notification = create_notification(db, invitee.id, message, "coparent_invitation", invitation.id)
-    invitation.notification_id = notification.id
 
-    return invitation
+def get_pending_invitations_json(db: Session, user_id: int) -> Tuple[bytes, str]:
+    """Get a user's pending co-parent invitations as cached JSON bytes and their ETag"""
+    key = user_cache_key(user_id, 'invitations')
+    return cached_json(key, INVITATION_CACHE_TTL, lambda: orjson.dumps(get_pending_invitations(db, user_id)))
 
 
 def get_pending_invitations(db: Session, user_id: int) -> List[Dict[str, Any]]:
     """Get all pending co-parent invitations for a user"""
-    invitations = db.query(CoParentInvitation).filter(
+    # Join in just the baby and inviter columns the response needs
+    invitations = db.query(
+        CoParentInvitation.id,
+        CoParentInvitation.created_at,
+        CoParentInvitation.status,
+        Baby.id.label('baby_id'),
+        Baby.fullname,
+        User.id.label('inviter_id'),
+        User.name,
+        User.email
+    ).join(Baby, Baby.id == CoParentInvitation.baby_id).join(
+        User, User.id == CoParentInvitation.inviter_id
+    ).filter(
         and_(
             CoParentInvitation.invitee_id == user_id,
-            CoParentInvitation.status == 'pending'
+            CoParentInvitation.status == InviteStatus.PENDING
         )
     ).all()
 
     # Prepare a detailed response with baby and inviter information
-    detailed_invitations = []
-    for invitation in invitations:
-        baby = db.query(Baby).filter(Baby.id == invitation.baby_id).first()
-        inviter = db.query(User).filter(User.id == invitation.inviter_id).first()
-        
-        detailed_invitations.append({
-            'invitation_id': invitation.id,
-            'created_at': invitation.created_at,
-            'baby_id': baby.id,
-            'baby_name': baby.fullname,
-            'inviter_id': inviter.id,
-            'inviter_name': inviter.name,
-            'inviter_email': inviter.email,
-            'status': invitation.status
-        })
-
-    return detailed_invitations
+    return [{
+        'invitation_id': invitation.id,
+        'created_at': invitation.created_at,
+        'baby_id': invitation.baby_id,
+        'baby_name': invitation.fullname,
+        'inviter_id': invitation.inviter_id,
+        'inviter_name': invitation.name,
+        'inviter_email': invitation.email,
+        'status': InviteStatus(invitation.status).label
+    } for invitation in invitations]
 
 
 def respond_to_invitation(db: Session, invitation_id: int, user_id: int, accept: bool) -> Union[Dict[str, str], Dict[str, str]]:
     """Accept or reject a co-parent invitation"""
-    # Find the invitation
-    invitation = db.query(CoParentInvitation).filter(
-        and_(
+    # Claim the pending invitation and read back what the rest needs in one
+    # statement; a concurrent response to the same invitation matches no row
+    row = db.execute(
+        update(CoParentInvitation).where(
             CoParentInvitation.id == invitation_id,
             CoParentInvitation.invitee_id == user_id,
-            CoParentInvitation.status == 'pending'
-        )
+            CoParentInvitation.status == InviteStatus.PENDING
+        ).values(
+            status=InviteStatus.ACCEPTED if accept else InviteStatus.REJECTED
+        ).returning(
+            CoParentInvitation.inviter_id,
+            CoParentInvitation.baby_id,
+            select(Baby.fullname).where(Baby.id == CoParentInvitation.baby_id).scalar_subquery()
+        ).execution_options(synchronize_session=False)
     ).first()
 
-    if not invitation:
+    if not row:
         return {
             'status': 'fail',
             'message': 'Invitation not found or already processed',
         }
+    inviter_id, baby_id, baby_name = row
 
-    # Update the invitation status
-    invitation.status = 'accepted' if accept else 'rejected'
-    db.commit()
+    # The invitee is the current user, so this comes from the identity map
+    invitee_name = db.get(User, user_id).name
 
-    # If accepted, add the co-parent relationship
+    # If accepted, add the user as a co-parent unless they already are one
     if accept:
-        baby = db.query(Baby).filter(Baby.id == invitation.baby_id).first()
-        invitee = db.query(User).filter(User.id == user_id).first()
-        
-        # Add the user as a co-parent
-        if invitee not in baby.coparents:
-            baby.coparents.append(invitee)
-            db.commit()
-        
-        # Create a notification for the inviter
-        message = f"{invitee.name} has accepted your co-parent invitation for {baby.fullname}"
-        create_notification(db, invitation.inviter_id, message, "coparent_accepted", invitation.id)
-        
-        return {
-            'status': 'success',
-            'message': f'You are now a co-parent for {baby.fullname}',
-        }
+        db.execute(baby_coparent.insert().from_select(
+            ['baby_id', 'user_id'],
+            select(literal(baby_id), literal(user_id)).where(~exists().where(
+                baby_coparent.c.baby_id == baby_id,
+                baby_coparent.c.user_id == user_id
+            ))
+        ))
+
+    # Notify the inviter, committing everything in one transaction
+    if accept:
+        message = f"{invitee_name} has accepted your co-parent invitation for {baby_name}"
+        create_notification(db, inviter_id, message, "coparent_accepted", invitation_id, commit=False)
     else:
-        # Create a notification for the inviter that invitation was rejected
-        invitee = db.query(User).filter(User.id == user_id).first()
-        baby = db.query(Baby).filter(Baby.id == invitation.baby_id).first()
-        message = f"{invitee.name} has declined your co-parent invitation for {baby.fullname}"
-        create_notification(db, invitation.inviter_id, message, "coparent_rejected", invitation.id)
-        
+        message = f"{invitee_name} has declined your co-parent invitation for {baby_name}"
+        create_notification(db, inviter_id, message, "coparent_rejected", invitation_id, commit=False)
+    db.commit()
+    invalidate_user_cache(user_id, 'invitations')
+
+    if accept:
         return {
             'status': 'success',
-            'message': 'Invitation declined',
+            'message': f'You are now a co-parent for {baby_name}',
         }
+    return {
+        'status': 'success',
+        'message': 'Invitation declined',
+    }
 
 
 def remove_coparent(db: Session, baby_id: int, coparent_id: int, coparent_email: str) -> Dict[str, str]:
     """Remove a co-parent from a baby"""
-    # Check if the baby exists and the current user is the parent
-    baby = db.query(Baby).filter(Baby.id == baby_id).first()
-    if not baby:
+    # Look up the baby and the user to remove in one round trip
+    if coparent_id == -1:
+        coparent_match = User.email == coparent_email
+    else:
+        coparent_match = User.id == coparent_id
+    row = db.query(Baby.fullname, User).select_from(Baby).outerjoin(User, coparent_match).filter(
+        Baby.id == baby_id
+    ).first()
+
+    # Check if the baby exists
+    if not row:
         return {
             'status': 'fail',
             'message': 'Baby not found',
         }
+    baby_name, coparent = row
 
-    if coparent_id == -1:
-        # Check if the user to remove is actually a co-parent
-        coparent = db.query(User).filter(User.email == coparent_email).first()
-        if not coparent:
-            return {
-                'status': 'fail',
-                'message': 'User not found',
-            }
-    else:
-        # Check if the user to remove is actually a co-parent
-        coparent = db.query(User).filter(User.id == coparent_id).first()
-        if not coparent:
-            return {
-                'status': 'fail',
-                'message': 'User not found',
-            }
-
-    # Remove the co-parent relationship
-    if coparent in baby.coparents:
-        baby.coparents.remove(coparent)
+    # Check if the user to remove exists
+    if coparent is None:
+        return {
+            'status': 'fail',
+            'message': 'User not found',
+        }
+
+    # Remove the co-parent relationship; the deleted row count tells whether there was one
+    removed = db.execute(baby_coparent.delete().where(
+        baby_coparent.c.baby_id == baby_id,
+        baby_coparent.c.user_id == coparent.id
+    )).rowcount
+    if removed:
+        # Create a notification for the removed co-parent in the same transaction
+        message = f"You have been removed as a co-parent for {baby_name}"
+        create_notification(db, coparent.id, message, "coparent_removed", baby_id, commit=False)
+        removed_name = coparent.name  # Read before the commit expires it
         db.commit()
-        
-        # Create a notification for the removed co-parent
-        message = f"You have been removed as a co-parent for {baby.fullname}"
-        create_notification(db, coparent_id, message, "coparent_removed", baby_id)
-        
+
         return {
             'status': 'success',
-            'message': f'{coparent.name} has been removed as a co-parent',
+            'message': f'{removed_name} has been removed as a co-parent',
         }
     else:
         return {
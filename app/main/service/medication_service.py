@@ -1,11 +1,13 @@
 from datetime import datetime
-from typing import Dict, List, Union, Any, Optional, Type
+from typing import Dict, List, Union, Any, Optional, Tuple, Type
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.main.model import User
-from app.main.model.medication import Medication
+from app.main.model.medication import Medication, MedicationResponseList
 from app.main.service.baby_service import get_baby_if_authorized
+from app.main.util.cache import MEDICATION_CACHE_TTL, baby_cache_key, cached_json, invalidate_baby_cache
+from app.main.util.db import bulk_insert
 
 
 def create_medication(db: Session, data: Dict[str, Any], current_user_id: int) -> Union[Medication, Dict[str, str]]:
@@ -17,7 +19,6 @@ def create_medication(db: Session, data: Dict[str, Any], current_user_id: int) -
 
     # Create new medication record
     new_medication = Medication(
-        created_at=datetime.utcnow(),
         name=data['name'],
         dosage=data['dosage'],
         dosage_unit=data['dosage_unit'],
@@ -32,6 +33,7 @@ def create_medication(db: Session, data: Dict[str, Any], current_user_id: int) -
     db.add(new_medication)
     db.commit()
     db.refresh(new_medication)
+    invalidate_baby_cache(new_medication.baby_id, 'medications')
 
     caregiver = db.query(User).filter(User.id == new_medication.recorded_by).first()
     if caregiver:
@@ -40,6 +42,36 @@ def create_medication(db: Session, data: Dict[str, Any], current_user_id: int) -
     return new_medication
 
 
+def bulk_create_medications(db: Session, rows: List[Dict[str, Any]], current_user_id: int) -> Dict[str, str]:
+    """Create several medication records with batched inserts"""
+    # Check authorization once per baby instead of once per record
+    for baby_id in {row['baby_id'] for row in rows}:
+        baby = get_baby_if_authorized(db, baby_id, current_user_id)
+        if isinstance(baby, dict):  # Error response
+            return baby
+
+    created = bulk_insert(db, Medication, [
+        {
+            'name': row['name'],
+            'dosage': row['dosage'],
+            'dosage_unit': row['dosage_unit'],
+            'route': row['route'],
+            'time_given': row['time_given'],
+            'reason': row.get('reason'),
+            'notes': row.get('notes'),
+            'baby_id': row['baby_id'],
+            'recorded_by': current_user_id
+        } for row in rows
+    ])
+    for baby_id in {row['baby_id'] for row in rows}:
+        invalidate_baby_cache(baby_id, 'medications')
+
+    return {
+        'status': 'success',
+        'message': f'{created} medication records created',
+    }
+
+
 def get_medications_for_baby(db: Session, baby_id: int, current_user_id: int,
                              skip: int = 0, limit: int = 100, start_date: Optional[datetime] = None,
                              end_date: Optional[datetime] = None) -> Union[dict[str, str], list[Type[Medication]]]:
@@ -49,6 +81,30 @@ def get_medications_for_baby(db: Session, baby_id: int, current_user_id: int,
     if isinstance(baby, dict):  # Error response
         return baby
 
+    return _query_medications_for_baby(db, baby_id, skip, limit, start_date, end_date)
+
+
+def get_medications_json_for_baby(db: Session, baby_id: int, current_user_id: int,
+                                  skip: int = 0, limit: int = 100, start_date: Optional[datetime] = None,
+                                  end_date: Optional[datetime] = None) -> Union[Dict[str, str], Tuple[bytes, str]]:
+    """Get medication records for a baby as cached JSON bytes and their ETag"""
+    # Check if user is authorized to view this baby's data
+    baby = get_baby_if_authorized(db, baby_id, current_user_id)
+    if isinstance(baby, dict):  # Error response
+        return baby
+
+    def produce() -> bytes:
+        medications = _query_medications_for_baby(db, baby_id, skip, limit, start_date, end_date)
+        return MedicationResponseList.dump_json(
+            MedicationResponseList.validate_python(medications, from_attributes=True))
+
+    key = baby_cache_key(baby_id, 'medications', skip, limit, start_date, end_date)
+    return cached_json(key, MEDICATION_CACHE_TTL, produce)
+
+
+def _query_medications_for_baby(db: Session, baby_id: int, skip: int, limit: int,
+                                start_date: Optional[datetime], end_date: Optional[datetime]) -> List[Medication]:
+    """Query a page of medication records for a baby with caregiver names filled in"""
     # Query medications
     query = db.query(Medication).filter(Medication.baby_id == baby_id)
 
@@ -61,14 +117,16 @@ def get_medications_for_baby(db: Session, baby_id: int, current_user_id: int,
     # Order by time descending (newest first)
     query = query.order_by(Medication.time_given.desc())
 
+    # Load caregivers in the same query instead of one per record
+    query = query.options(joinedload(Medication.caregiver))
+
     # Apply pagination
     medications = query.offset(skip).limit(limit).all()
 
     # Add caregiver information to each medication record
     for medication in medications:
-        caregiver = db.query(User).filter(User.id == medication.recorded_by).first()
-        if caregiver:
-            medication.caregiver_name = caregiver.name
+        if medication.caregiver:
+            medication.caregiver_name = medication.caregiver.name
 
     return medications
 
@@ -125,6 +183,7 @@ def update_medication(db: Session, medication_id: int, data: Dict[str, Any], cur
 
     db.commit()
     db.refresh(medication)
+    invalidate_baby_cache(medication.baby_id, 'medications')
 
     caregiver = db.query(User).filter(User.id == medication.recorded_by).first()
     if caregiver:
@@ -151,4 +210,5 @@ def delete_medication(db: Session, medication_id: int, current_user_id: int) ->
     # Delete the medication record
     db.delete(medication)
     db.commit()
+    invalidate_baby_cache(baby.id, 'medications')
     return {'status': 'DELETED'}
\ No newline at end of file
@@ -1,13 +1,16 @@
 from datetime import datetime
-from typing import Dict, Union, Any, Optional, Type
+from typing import Dict, List, Union, Any, Optional, Tuple, Type
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.main.model import User
-from app.main.model.milestone import Milestone
+from app.main.model.milestone import Milestone, MilestoneResponseList
 from app.main.model.photo import Photo, PhotoType
 from app.main.service.aws_service import create_presigned_url
 from app.main.service.baby_service import get_baby_if_authorized
+from app.main.util.cache import MILESTONE_CACHE_TTL, baby_cache_key, cached_json, invalidate_baby_cache
+from app.main.util.db import bulk_insert
 
 
 def create_milestone(db: Session, data: Dict[str, Any], current_user_id: int) -> Union[Milestone, Dict[str, str]]:
@@ -19,7 +22,6 @@ def create_milestone(db: Session, data: Dict[str, Any], current_user_id: int) ->
 
     # Create new milestone record
     new_milestone = Milestone(
-        created_at=datetime.utcnow(),
         title=data['title'],
         category=data['category'],
         achieved_date=data['achieved_date'],
@@ -55,6 +57,9 @@ def create_milestone(db: Session, data: Dict[str, Any], current_user_id: int) ->
             new_milestone.photo_url = create_presigned_url(new_milestone.photo_url)
             db.commit()
 
+    # Linking a photo changes the baby's photo listing as well
+    invalidate_baby_cache(new_milestone.baby_id, 'milestones', 'photos')
+
     caregiver = db.query(User).filter(User.id == new_milestone.recorded_by).first()
     if caregiver:
         new_milestone.caregiver_name = caregiver.name
@@ -62,6 +67,34 @@ def create_milestone(db: Session, data: Dict[str, Any], current_user_id: int) ->
     return new_milestone
 
 
+def bulk_create_milestones(db: Session, rows: List[Dict[str, Any]], current_user_id: int) -> Dict[str, str]:
+    """Create several developmental milestone records with batched inserts"""
+    # Check authorization once per baby instead of once per record
+    for baby_id in {row['baby_id'] for row in rows}:
+        baby = get_baby_if_authorized(db, baby_id, current_user_id)
+        if isinstance(baby, dict):  # Error response
+            return baby
+
+    created = bulk_insert(db, Milestone, [
+        {
+            'title': row['title'],
+            'category': row['category'],
+            'achieved_date': row['achieved_date'],
+            'description': row.get('description'),
+            'notes': row.get('notes'),
+            'baby_id': row['baby_id'],
+            'recorded_by': current_user_id
+        } for row in rows
+    ])
+    for baby_id in {row['baby_id'] for row in rows}:
+        invalidate_baby_cache(baby_id, 'milestones')
+
+    return {
+        'status': 'success',
+        'message': f'{created} milestone records created',
+    }
+
+
 def get_milestones_for_baby(db: Session, baby_id: int, current_user_id: int,
                             skip: int = 0, limit: int = 100, start_date: Optional[datetime] = None,
                             end_date: Optional[datetime] = None) -> Union[dict[str, str], list[Type[Milestone]]]:
@@ -71,6 +104,30 @@ def get_milestones_for_baby(db: Session, baby_id: int, current_user_id: int,
     if isinstance(baby, dict):  # Error response
         return baby
 
+    return _query_milestones_for_baby(db, baby_id, skip, limit, start_date, end_date)
+
+
+def get_milestones_json_for_baby(db: Session, baby_id: int, current_user_id: int,
+                                 skip: int = 0, limit: int = 100, start_date: Optional[datetime] = None,
+                                 end_date: Optional[datetime] = None) -> Union[Dict[str, str], Tuple[bytes, str]]:
+    """Get developmental milestone records for a baby as cached JSON bytes and their ETag"""
+    # Check if user is authorized to view this baby's data
+    baby = get_baby_if_authorized(db, baby_id, current_user_id)
+    if isinstance(baby, dict):  # Error response
+        return baby
+
+    def produce() -> bytes:
+        milestones = _query_milestones_for_baby(db, baby_id, skip, limit, start_date, end_date)
+        return MilestoneResponseList.dump_json(
+            MilestoneResponseList.validate_python(milestones, from_attributes=True))
+
+    key = baby_cache_key(baby_id, 'milestones', skip, limit, start_date, end_date)
+    return cached_json(key, MILESTONE_CACHE_TTL, produce)
+
+
+def _query_milestones_for_baby(db: Session, baby_id: int, skip: int, limit: int,
+                               start_date: Optional[datetime], end_date: Optional[datetime]) -> List[Milestone]:
+    """Query a page of milestone records for a baby with photo URLs and caregiver names filled in"""
     # Query milestones
     query = db.query(Milestone).filter(Milestone.baby_id == baby_id)
 
@@ -83,21 +140,22 @@ def get_milestones_for_baby(db: Session, baby_id: int, current_user_id: int,
     # Order by date descending (newest first)
     query = query.order_by(Milestone.achieved_date.desc())
 
+    # Load photos and caregivers in two extra queries instead of two per record
+    query = query.options(selectinload(Milestone.photos), selectinload(Milestone.caregiver))
+
     # Apply pagination
     milestones = query.offset(skip).limit(limit).all()
 
-    # Refresh photo URLs if they exist but might be expired
     for milestone in milestones:
-        # If this milestone has photos, get the first one and update the photo_url
-        photos = db.query(Photo).filter(Photo.milestone_id == milestone.id).first()
-        if photos and not milestone.photo_url:
-            milestone.photo_url = create_presigned_url(photos.s3_key)
-            db.commit()
+        # If this milestone has photos, use the first one for the photo_url; the
+        # presigned URL is only for this response, so it is set without marking
+        # the row dirty and nothing is written on this read path
+        if milestone.photos and not milestone.photo_url:
+            set_committed_value(milestone, 'photo_url', create_presigned_url(milestone.photos[0].s3_key))
 
         # Add caregiver information to each milestone record
-        caregiver = db.query(User).filter(User.id == milestone.recorded_by).first()
-        if caregiver:
-            milestone.caregiver_name = caregiver.name
+        if milestone.caregiver:
+            milestone.caregiver_name = milestone.caregiver.name
 
     return milestones
 
@@ -122,8 +180,7 @@ def get_milestone(db: Session, milestone_id: int, current_user_id: int) -> Union
     # Refresh photo URL if it exists but might be expired
     photos = db.query(Photo).filter(Photo.milestone_id == milestone.id).first()
     if photos and not milestone.photo_url:
-        milestone.photo_url = create_presigned_url(photos.s3_key)
-        db.commit()
+        set_committed_value(milestone, 'photo_url', create_presigned_url(photos.s3_key))
 
     caregiver = db.query(User).filter(User.id == milestone.recorded_by).first()
     if caregiver:
@@ -184,6 +241,7 @@ def update_milestone(db: Session, milestone_id: int, data: Dict[str, Any], curre
 
     db.commit()
     db.refresh(milestone)
+    invalidate_baby_cache(milestone.baby_id, 'milestones', 'photos')
 
     caregiver = db.query(User).filter(User.id == milestone.recorded_by).first()
     if caregiver:
@@ -217,4 +275,5 @@ def delete_milestone(db: Session, milestone_id: int, current_user_id: int) -> Un
     # Delete the milestone record
     db.delete(milestone)
     db.commit()
+    invalidate_baby_cache(baby.id, 'milestones', 'photos')
     return {'status': 'DELETED'}
\ No newline at end of file
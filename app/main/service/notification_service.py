@@ -1,16 +1,16 @@
-from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
 # Import Notification from the updated schema
 from app.main.model.parent_child_schema import Notification, CoParentInvitation
+from app.main.model.user import User
 
 
-def create_notification(db: Session, user_id: int, message: str, notification_type: str, reference_id: Optional[int] = None) -> Notification:
-    """Create a new notification for a user"""
+def create_notification(db: Session, user_id: int, message: str, notification_type: str, reference_id: Optional[int] = None,
+                        commit: bool = True) -> Notification:
+    """Create a new notification for a user; pass commit=False to leave it in the caller's transaction"""
     notification = Notification(
-        created_at=datetime.utcnow(),
         user_id=user_id,
         message=message,
         type=notification_type,
@@ -19,8 +19,12 @@ def create_notification(db: Session, user_id: int, message: str, notification_ty
     )
     
     db.add(notification)
-    db.commit()
-    db.refresh(notification)
+    if commit:
+        db.commit()
+        db.refresh(notification)
+    else:
+        # Flush so the notification has its id before the caller commits
+        db.flush()
     return notification
 
 
@@ -49,6 +53,16 @@ def get_user_notifications(db: Session, user_id: int, unread_only: bool = False)
     return notification_list
 
 
+def get_unread_notification_count(db: Session, user_id: int) -> Dict[str, int]:
+    """Get the number of unread notifications for a user"""
+    # Read the trigger-maintained counter instead of counting notification rows
+    count = db.query(User.unread_notifications).filter(User.id == user_id).scalar()
+
+    return {
+        'unread_count': count or 0,
+    }
+
+
 def mark_notification_read(db: Session, notification_id: int, user_id: int) -> Union[Dict[str, str], Dict[str, str]]:
     """Mark a notification as read"""
     notification = db.query(Notification).filter(
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import Dict
 
 from fastapi import HTTPException, status, Depends, Security
@@ -11,12 +12,6 @@ from app.main import get_db
 from app.main.model.user import User
 from app.main.service.user_service import get_user_by_google_id, create_user
 
-# Load the client secret file
-with open('client_secret.json', 'r') as f:
-    client_config = json.load(f)['web']
-
-CLIENT_ID = client_config['client_id']
-CLIENT_SECRET = client_config['client_secret']
 # Use the first redirect URI from the config, but ensure it points to our callback route
 BASE_URI = "http://127.0.0.1:8000"
 REDIRECT_URI = f"{BASE_URI}/auth/callback"
@@ -25,11 +20,18 @@ REDIRECT_URI = f"{BASE_URI}/auth/callback"
 security = HTTPBearer()
 
 
+@lru_cache(maxsize=None)
+def get_client_config() -> Dict[str, str]:
+    """Load the Google OAuth client settings from the client secret file on first use"""
+    with open('client_secret.json', 'r') as f:
+        return json.load(f)['web']
+
+
 def verify_google_token(token: str) -> Dict:
     """Verify the Google ID token"""
     try:
-        # Specify the CLIENT_ID of the app that accesses the backend
-        idinfo = id_token.verify_oauth2_token(token, requests.Request(), CLIENT_ID)
+        # Specify the client id of the app that accesses the backend
+        idinfo = id_token.verify_oauth2_token(token, requests.Request(), get_client_config()['client_id'])
 
         # Verify issuer
         if idinfo['iss'] not in ['accounts.google.com', 'https://accounts.google.com']:
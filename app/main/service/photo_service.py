@@ -1,14 +1,17 @@
 from datetime import datetime
-from typing import Dict, List, Union, Any, Optional
+from typing import Dict, List, Union, Any, Optional, Tuple
 import uuid
 
-from sqlalchemy.orm import Session
+import orjson
+
+from sqlalchemy.orm import Session, selectinload
 
 from app.main.model import User
 from app.main.model.photo import Photo, PhotoType
 from app.main.model.milestone import Milestone
 from app.main.service.baby_service import get_baby_if_authorized
-from app.main.service.aws_service import upload_file, create_presigned_url
+from app.main.service.aws_service import upload_file_async, create_presigned_url
+from app.main.util.cache import PHOTO_CACHE_TTL, baby_cache_key, cached_json, invalidate_baby_cache
 
 
 async def upload_baby_profile_picture(db: Session, baby_id: int, file, current_user_id: int) -> Dict[str, Any]:
@@ -27,7 +30,7 @@ async def upload_baby_profile_picture(db: Session, baby_id: int, file, current_u
     file_content = await file.read()
 
     # Upload to S3
-    if upload_file(file_content, s3_key):
+    if await upload_file_async(file_content, s3_key):
         # Update baby record with picture path
         baby.picture = s3_key
         db.commit()
@@ -78,7 +81,7 @@ async def upload_baby_photo(db: Session, data: Dict[str, Any], file, current_use
     file_content = await file.read()
 
     # Upload to S3
-    if not upload_file(file_content, s3_key):
+    if not await upload_file_async(file_content, s3_key):
         return {
             'status': 'fail',
             'message': 'Failed to upload photo'
@@ -86,7 +89,6 @@ async def upload_baby_photo(db: Session, data: Dict[str, Any], file, current_use
 
     # Create new photo record
     new_photo = Photo(
-        created_at=datetime.utcnow(),
         photo_type=data['photo_type'] if not milestone else PhotoType.MILESTONE,
         description=data.get('description'),
         date_taken=data.get('date_taken', datetime.utcnow()),
@@ -106,6 +108,8 @@ async def upload_baby_photo(db: Session, data: Dict[str, Any], file, current_use
         milestone.photo_url = url
         db.commit()
 
+    invalidate_baby_cache(new_photo.baby_id, 'photos', 'milestones')
+
     caregiver = db.query(User).filter(User.id == new_photo.recorded_by).first()
     if caregiver:
         new_photo.caregiver_name = caregiver.name
@@ -122,6 +126,23 @@ def get_baby_photos(db: Session, baby_id: int, current_user_id: int, photo_type:
     if isinstance(baby, dict):  # Error response
         return baby
 
+    return _list_baby_photos(db, baby_id, photo_type)
+
+
+def get_baby_photos_json(db: Session, baby_id: int, current_user_id: int,
+                         photo_type: Optional[PhotoType] = None) -> Union[Dict[str, str], Tuple[bytes, str]]:
+    """Get all photos for a baby as cached JSON bytes and their ETag"""
+    # Check if user is authorized to view this baby's data
+    baby = get_baby_if_authorized(db, baby_id, current_user_id)
+    if isinstance(baby, dict):  # Error response
+        return baby
+
+    key = baby_cache_key(baby_id, 'photos', photo_type)
+    return cached_json(key, PHOTO_CACHE_TTL, lambda: orjson.dumps(_list_baby_photos(db, baby_id, photo_type)))
+
+
+def _list_baby_photos(db: Session, baby_id: int, photo_type: Optional[PhotoType]) -> List[Dict[str, Any]]:
+    """Build the photo listing for a baby with presigned URLs"""
     # Query photos
     query = db.query(Photo).filter(Photo.baby_id == baby_id)
 
@@ -129,14 +150,14 @@ def get_baby_photos(db: Session, baby_id: int, current_user_id: int, photo_type:
     if photo_type:
         query = query.filter(Photo.photo_type == photo_type)
 
-    # Get all matching photos
-    photos = query.all()
+    # Get all matching photos, loading caregivers in one extra query
+    photos = query.options(selectinload(Photo.caregiver)).all()
 
 
     # Create response with presigned URLs
     result = []
     for photo in photos:
-        caregiver = db.query(User).filter(User.id == photo.recorded_by).first()
+        caregiver = photo.caregiver
         if caregiver:
             photo.caregiver_name = caregiver.name
 
@@ -174,12 +195,13 @@ def get_photos_for_milestone(db: Session, milestone_id: int, current_user_id: in
         return baby
 
     # Query photos
-    photos = db.query(Photo).filter(Photo.milestone_id == milestone_id).all()
+    photos = db.query(Photo).filter(Photo.milestone_id == milestone_id).options(
+        selectinload(Photo.caregiver)).all()
 
     # Create response with presigned URLs
     result = []
     for photo in photos:
-        caregiver = db.query(User).filter(User.id == photo.recorded_by).first()
+        caregiver = photo.caregiver
         if caregiver:
             photo.caregiver_name = caregiver.name
         photo_dict = {
@@ -244,6 +266,7 @@ def link_photo_to_milestone(db: Session, photo_id: int, milestone_id: int, curre
     milestone.photo_url = url
 
     db.commit()
+    invalidate_baby_cache(photo.baby_id, 'photos', 'milestones')
 
     return {
         'status': 'success',
@@ -277,6 +300,7 @@ def delete_photo(db: Session, photo_id: int, current_user_id: int) -> Union[Dict
     # Delete the photo record
     db.delete(photo)
     db.commit()
+    invalidate_baby_cache(baby.id, 'photos', 'milestones')
 
     # Note: We're not deleting from S3 here
 
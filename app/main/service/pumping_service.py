@@ -1,13 +1,14 @@
 from datetime import datetime
-from typing import Dict, List, Union, Any, Optional
+from typing import Dict, List, Union, Any, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
 from app.main.model.pumping import Pumping
+from app.main.util.db import bulk_insert
 
 
-def create_pumping(db: Session, data: Dict[str, Any], current_user_id: int) -> Union[Pumping, Dict[str, str]]:
-    """Create a new pumping session record for a user"""
+def _calculate_duration_and_total(data: Dict[str, Any]) -> Tuple[Optional[int], Optional[float]]:
+    """Fill in duration and total amount when they can be derived from the other fields"""
     # Calculate duration if both start and end times are provided
     duration = data.get('duration')
     if data.get('end_time') and not duration:
@@ -20,9 +21,15 @@ def create_pumping(db: Session, data: Dict[str, Any], current_user_id: int) -> U
     if data.get('left_amount') is not None and data.get('right_amount') is not None and total_amount is None:
         total_amount = data.get('left_amount', 0) + data.get('right_amount', 0)
 
+    return duration, total_amount
+
+
+def create_pumping(db: Session, data: Dict[str, Any], current_user_id: int) -> Union[Pumping, Dict[str, str]]:
+    """Create a new pumping session record for a user"""
+    duration, total_amount = _calculate_duration_and_total(data)
+
     # Create new pumping record
     new_pumping = Pumping(
-        created_at=datetime.utcnow(),
         start_time=data['start_time'],
         end_time=data.get('end_time'),
         duration=duration,
@@ -39,6 +46,29 @@ def create_pumping(db: Session, data: Dict[str, Any], current_user_id: int) -> U
     return new_pumping
 
 
+def bulk_create_pumpings(db: Session, rows: List[Dict[str, Any]], current_user_id: int) -> Dict[str, str]:
+    """Create several pumping session records with batched inserts"""
+    mappings = []
+    for row in rows:
+        duration, total_amount = _calculate_duration_and_total(row)
+        mappings.append({
+            'start_time': row['start_time'],
+            'end_time': row.get('end_time'),
+            'duration': duration,
+            'left_amount': row.get('left_amount'),
+            'right_amount': row.get('right_amount'),
+            'total_amount': total_amount,
+            'notes': row.get('notes'),
+            'user_id': current_user_id
+        })
+
+    created = bulk_insert(db, Pumping, mappings)
+    return {
+        'status': 'success',
+        'message': f'{created} pumping session records created',
+    }
+
+
 def get_pumpings_for_user(db: Session, user_id: int,
                           skip: int = 0, limit: int = 100, start_date: Optional[datetime] = None,
                           end_date: Optional[datetime] = None) -> List[Pumping]:
@@ -2,17 +2,26 @@
 Tool service for managing tools and their executions.
 Handles tool CRUD operations and execution logic.
 """
+import threading
 import time
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, Type
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.main.model.tool import Tool, ToolExecution, ToolType, ToolStatus
 from app.main.service.baby_service import _get_baby_ids
 from app.main.service.tool.base.registry import ToolRegistry
 
+# Tools only change through the admin endpoints, which drop the cached list;
+# the TTL bounds how long other worker processes keep serving an old one
+ACTIVE_TOOLS_CACHE_TTL = 60
+
+_active_tools = None
+_active_tools_lock = threading.Lock()
+
 
 def create_tool(db: Session, tool_data: Dict[str, Any]) -> Tool:
     """Create a new tool configuration"""
@@ -38,6 +47,7 @@ def create_tool(db: Session, tool_data: Dict[str, Any]) -> Tool:
     db.add(new_tool)
     db.commit()
     db.refresh(new_tool)
+    invalidate_active_tools()
     return new_tool
 
 
@@ -61,10 +71,34 @@ def get_tools_by_type(db: Session, tool_type: ToolType) -> list[Type[Tool]]:
 
 def get_active_tools(db: Session) -> list[Type[Tool]]:
     """Get all active tools"""
-    return db.query(Tool).filter(
-        Tool.status == ToolStatus.ACTIVE,
-        Tool.is_active == True
-    ).all()
+    global _active_tools
+    now = time.monotonic()
+    cached = _active_tools
+    if cached and cached[0] > now:
+        return list(cached[1])
+
+    # Only one caller reloads an expired list; the rest wait and reuse its result
+    with _active_tools_lock:
+        cached = _active_tools
+        if cached and cached[0] > now:
+            return list(cached[1])
+
+        # A stable order keeps the tool-selection prompt prefix identical between loads
+        tools = db.query(Tool).filter(
+            Tool.status == ToolStatus.ACTIVE,
+            Tool.is_active == True
+        ).order_by(Tool.id).all()
+        # Detach the rows so later commits in this session don't expire the shared copies
+        for tool in tools:
+            db.expunge(tool)
+        _active_tools = (now + ACTIVE_TOOLS_CACHE_TTL, tools)
+    return list(tools)
+
+
+def invalidate_active_tools() -> None:
+    """Drop the cached active tool list after a tool changes"""
+    global _active_tools
+    _active_tools = None
 
 def get_all_tools(db: Session) -> list[Type[Tool]]:
     """Get all active tools"""
@@ -97,6 +131,7 @@ def update_tool(db: Session, tool_id: int, tool_data: Dict[str, Any]) -> Optiona
 
     db.commit()
     db.refresh(tool)
+    invalidate_active_tools()
     return tool
 
 
@@ -112,7 +147,7 @@ def execute_tool(
     baby_ids = _get_baby_ids(db, user_id, baby_id)
 
     start_time = time.time()
-    execution_id = str(uuid.uuid4())
+    execution_id = uuid.uuid4()
 
     # Get the tool
     tool = get_tool(db, tool_id)
@@ -149,15 +184,17 @@ def execute_tool(
         execution.status = "success"
         execution.execution_time_ms = execution_time
 
-        # Update tool usage stats
-        tool.usage_count += 1
-        tool.last_used_at = datetime.utcnow()
+        # Update tool usage stats in place so concurrent executions don't lose counts
+        db.query(Tool).filter(Tool.id == tool_id).update({
+            Tool.usage_count: func.coalesce(Tool.usage_count, 0) + 1,
+            Tool.last_used_at: datetime.utcnow()
+        }, synchronize_session=False)
 
         db.commit()
 
         return {
             "tool_id": tool_id,
-            "execution_id": execution_id,
+            "execution_id": str(execution_id),
             "status": "success",
             "data": result,
             "metadata": {
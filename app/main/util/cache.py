@@ -0,0 +1,96 @@
+"""
+In-process cache for serialized responses of read-mostly list endpoints.
+
+Entries hold the final JSON bytes together with an ETag, so a cache hit skips
+both the database query and Pydantic serialization. Writes to a baby's records
+drop that baby's entries through invalidate_baby_cache, and per-user lists are
+dropped through invalidate_user_cache.
+"""
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Response, status
+
+# Seconds before a cached list is rebuilt even without a write
+MEDICATION_CACHE_TTL = 60
+MILESTONE_CACHE_TTL = 300
+PHOTO_CACHE_TTL = 300
+INVITATION_CACHE_TTL = 30
+
+# Expired entries are swept once the cache grows past this many keys
+MAX_CACHE_ENTRIES = 10000
+
+_entries: Dict[str, Tuple[float, bytes, str]] = {}
+# Bumped by every invalidation of an owner's lists, so a body built from data
+# read before the invalidation is never stored after it
+_generations: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def _owner_prefix(key: str) -> str:
+    """Return the 'baby:<id>:' or 'user:<id>:' part of a cache key"""
+    kind, owner_id, _ = key.split(':', 2)
+    return f"{kind}:{owner_id}:"
+
+
+def baby_cache_key(baby_id: int, entity: str, *params: Any) -> str:
+    """Build the cache key for one list of a baby's records and its query parameters"""
+    return f"baby:{baby_id}:{entity}:v1:" + ":".join(str(param) for param in params)
+
+
+def user_cache_key(user_id: int, entity: str, *params: Any) -> str:
+    """Build the cache key for one list belonging to a user and its query parameters"""
+    return f"user:{user_id}:{entity}:v1:" + ":".join(str(param) for param in params)
+
+
+def cached_json(key: str, ttl: int, producer: Callable[[], bytes]) -> Tuple[bytes, str]:
+    """Return (body, etag) for key, calling producer when missing or expired"""
+    now = time.monotonic()
+    entry = _entries.get(key)
+    if entry and entry[0] > now:
+        return entry[1], entry[2]
+
+    owner_prefix = _owner_prefix(key)
+    generation = _generations.get(owner_prefix, 0)
+    body = producer()
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+    with _lock:
+        if _generations.get(owner_prefix, 0) != generation:
+            # A write invalidated this owner while the body was being built
+            return body, etag
+        if len(_entries) >= MAX_CACHE_ENTRIES:
+            for stale_key in [k for k, v in _entries.items() if v[0] <= now]:
+                del _entries[stale_key]
+            if len(_entries) >= MAX_CACHE_ENTRIES:
+                _entries.clear()
+        _entries[key] = (now + ttl, body, etag)
+
+    return body, etag
+
+
+def invalidate_baby_cache(baby_id: int, *entities: str) -> None:
+    """Drop cached lists for a baby, limited to the given entities if any are passed"""
+    _invalidate(f"baby:{baby_id}:", entities)
+
+
+def invalidate_user_cache(user_id: int, *entities: str) -> None:
+    """Drop cached lists for a user, limited to the given entities if any are passed"""
+    _invalidate(f"user:{user_id}:", entities)
+
+
+def _invalidate(owner_prefix: str, entities: Tuple[str, ...]) -> None:
+    prefixes = tuple(f"{owner_prefix}{entity}:" for entity in entities) or (owner_prefix,)
+    with _lock:
+        _generations[owner_prefix] = _generations.get(owner_prefix, 0) + 1
+        for key in [k for k in _entries if k.startswith(prefixes)]:
+            del _entries[key]
+
+
+def cached_json_response(body: bytes, etag: str, if_none_match: Optional[str] = None) -> Response:
+    """Build the response for cached JSON, answering 304 when the client already holds it"""
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -0,0 +1,63 @@
+"""
+Database helpers shared by the service layer.
+"""
+from enum import Enum
+from typing import Any, Dict, List, Optional, Type
+
+from sqlalchemy import CHAR, DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+# PostgreSQL gets slower with very large multi-row statements, so bulk
+# inserts are sent in batches of at most this many rows
+BULK_INSERT_BATCH_SIZE = 1000
+
+
+def bulk_insert(db: Session, model: Any, rows: List[Dict[str, Any]],
+                batch_size: int = BULK_INSERT_BATCH_SIZE) -> int:
+    """Insert plain row dicts for a model in batches and commit once"""
+    for start in range(0, len(rows), batch_size):
+        db.bulk_insert_mappings(model, rows[start:start + batch_size])
+    db.commit()
+    return len(rows)
+
+
+class EnumCode(TypeDecorator):
+    """Store a str Enum as a single character code instead of a database ENUM type"""
+    impl = CHAR(1)
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum], codes: Dict[Enum, str]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._codes = dict(codes)
+        self._members = {code: member for member, code in codes.items()}
+
+    def process_bind_param(self, value: Optional[Any], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value: Optional[str], dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._members[value]
+
+
+class utcnow(FunctionElement):
+    """Current UTC time computed by the database, for use as a server_default"""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, 'postgresql')
+def _pg_utcnow(element, compiler, **kw):
+    # Columns are TIMESTAMP WITHOUT TIME ZONE holding UTC, so drop the session time zone
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
@@ -0,0 +1,71 @@
+"""
+Per-request SQL statement counting for development.
+
+When SQLALCHEMY_COUNT_QUERIES is enabled, every statement executed on the
+application engine is counted against the request that issued it and the
+total is returned in an X-Query-Count header. Routes listed in QUERY_BUDGETS
+log a warning when they go over budget, which is how N+1 regressions show up.
+"""
+import logging
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+logger = logging.getLogger(__name__)
+
+# Statements allowed per request on a cache miss, counting the user lookup and
+# the baby authorization check, keyed by method and route path since writes
+# often share a path with a list
+QUERY_BUDGETS = {
+    ('GET', '/baby/'): 4,
+    ('GET', '/medication/baby/{baby_id}'): 4,
+    ('GET', '/milestone/baby/{baby_id}'): 5,
+    ('GET', '/photos/baby/{baby_id}'): 4,
+    ('GET', '/pumping/'): 2,
+    ('GET', '/notifications/unread-count'): 2,
+    ('GET', '/coparent/invitations'): 2,
+    ('POST', '/coparent/invite'): 4,
+    ('POST', '/coparent/invitations/{invitation_id}'): 4,
+    ('DELETE', '/coparent/baby/{baby_id}/coparent/'): 4,
+}
+
+# Holds a one-item list so that work run in the threadpool, which gets a
+# copy of the context, still adds to the request's counter
+_query_count: ContextVar[Optional[List[int]]] = ContextVar('query_count', default=None)
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def install_query_counter(engine: Engine) -> None:
+    """Start counting statements executed on the given engine"""
+    if not event.contains(engine, 'before_cursor_execute', _count_statement):
+        event.listen(engine, 'before_cursor_execute', _count_statement)
+
+
+class QueryCountMiddleware(BaseHTTPMiddleware):
+    """Report the number of SQL statements each request executed"""
+
+    async def dispatch(self, request, call_next):
+        counter = [0]
+        token = _query_count.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            _query_count.reset(token)
+
+        response.headers['X-Query-Count'] = str(counter[0])
+
+        route = request.scope.get('route')
+        budget = QUERY_BUDGETS.get((request.method, getattr(route, 'path', None)))
+        if budget is not None and counter[0] > budget:
+            logger.warning("%s %s ran %d queries (budget %d)",
+                           request.method, request.url.path, counter[0], budget)
+
+        return response
@@ -0,0 +1,48 @@
+"""Store co-parent invitation status as a small integer
+
+Revision ID: 0a9d4e6b7c35
+Revises: f2a6c9d13e47
+Create Date: 2026-10-17 13:24:12.871630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a9d4e6b7c35'
+down_revision: Union[str, None] = 'f2a6c9d13e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 0 = pending, 1 = accepted, 2 = rejected (InviteStatus); the default
+    # has to be dropped while the column type changes
+    op.alter_column('coparent_invitation', 'status', existing_type=sa.String(20), server_default=None)
+    op.alter_column(
+        'coparent_invitation', 'status',
+        existing_type=sa.String(20),
+        type_=sa.SmallInteger(),
+        nullable=False,
+        postgresql_using="CASE status WHEN 'accepted' THEN 1 WHEN 'rejected' THEN 2 ELSE 0 END"
+    )
+    op.alter_column('coparent_invitation', 'status', existing_type=sa.SmallInteger(), server_default='0')
+    op.create_index('ix_coparent_pending', 'coparent_invitation', ['invitee_id'], unique=False,
+                    postgresql_where=sa.text('status = 0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_coparent_pending', table_name='coparent_invitation', postgresql_where=sa.text('status = 0'))
+    op.alter_column('coparent_invitation', 'status', existing_type=sa.SmallInteger(), server_default=None)
+    op.alter_column(
+        'coparent_invitation', 'status',
+        existing_type=sa.SmallInteger(),
+        type_=sa.String(20),
+        nullable=True,
+        postgresql_using="CASE status WHEN 1 THEN 'accepted' WHEN 2 THEN 'rejected' ELSE 'pending' END"
+    )
@@ -0,0 +1,31 @@
+"""Unlink photos from deleted milestones in the database
+
+Revision ID: 1b5e8f2a9d64
+Revises: 0a9d4e6b7c35
+Create Date: 2026-10-17 14:02:45.309127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b5e8f2a9d64'
+down_revision: Union[str, None] = '0a9d4e6b7c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('photo_milestone_id_fkey', 'photo', type_='foreignkey')
+    op.create_foreign_key('photo_milestone_id_fkey', 'photo', 'milestone',
+                          ['milestone_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('photo_milestone_id_fkey', 'photo', type_='foreignkey')
+    op.create_foreign_key('photo_milestone_id_fkey', 'photo', 'milestone', ['milestone_id'], ['id'])
@@ -0,0 +1,51 @@
+"""Store tool type and status as native enums
+
+Revision ID: 2c7a0f4e8b19
+Revises: 1b5e8f2a9d64
+Create Date: 2026-10-17 15:02:41.318904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c7a0f4e8b19'
+down_revision: Union[str, None] = '1b5e8f2a9d64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TOOL_TYPES = (
+    'activity_analyzer', 'sleep_pattern_analyzer', 'feeding_tracker', 'health_monitor',
+    'growth_tracker', 'milestone_tracker', 'care_metrics_analyzer', 'schedule_assistant',
+)
+TOOL_STATUSES = ('active', 'inactive', 'maintenance')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tool_type_enum = postgresql.ENUM(*TOOL_TYPES, name='tool_type_enum')
+    tool_status_enum = postgresql.ENUM(*TOOL_STATUSES, name='tool_status_enum')
+    tool_type_enum.create(op.get_bind())
+    tool_status_enum.create(op.get_bind())
+
+    op.alter_column('tool', 'tool_type', existing_type=sa.String(22), type_=tool_type_enum,
+                    existing_nullable=False, postgresql_using='tool_type::tool_type_enum')
+    op.alter_column('tool', 'status', existing_type=sa.String(11), type_=tool_status_enum,
+                    existing_nullable=False, postgresql_using='status::tool_status_enum')
+    op.create_index('ix_tool_active_type', 'tool', ['status', 'tool_type'], unique=False,
+                    postgresql_where=sa.text('is_active'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tool_active_type', table_name='tool', postgresql_where=sa.text('is_active'))
+    op.alter_column('tool', 'status', existing_type=postgresql.ENUM(name='tool_status_enum'),
+                    type_=sa.String(11), existing_nullable=False, postgresql_using='status::text')
+    op.alter_column('tool', 'tool_type', existing_type=postgresql.ENUM(name='tool_type_enum'),
+                    type_=sa.String(22), existing_nullable=False, postgresql_using='tool_type::text')
+    postgresql.ENUM(name='tool_status_enum').drop(op.get_bind())
+    postgresql.ENUM(name='tool_type_enum').drop(op.get_bind())
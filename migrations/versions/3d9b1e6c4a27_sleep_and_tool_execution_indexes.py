@@ -0,0 +1,30 @@
+"""Add composite indexes for sleep lists and tool execution history
+
+Revision ID: 3d9b1e6c4a27
+Revises: 2c7a0f4e8b19
+Create Date: 2026-10-17 15:31:08.642117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9b1e6c4a27'
+down_revision: Union[str, None] = '2c7a0f4e8b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_sleep_baby_start', 'sleep', ['baby_id', 'start_time'], unique=False)
+    op.create_index('ix_toolexec_tool_created', 'tool_execution', ['tool_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_toolexec_tool_created', table_name='tool_execution')
+    op.drop_index('ix_sleep_baby_start', table_name='sleep')
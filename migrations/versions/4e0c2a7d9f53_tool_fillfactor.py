@@ -0,0 +1,31 @@
+"""Leave free space in tool pages for in-place usage updates
+
+Revision ID: 4e0c2a7d9f53
+Revises: 3d9b1e6c4a27
+Create Date: 2026-10-17 16:05:52.190473
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e0c2a7d9f53'
+down_revision: Union[str, None] = '3d9b1e6c4a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Applies to pages written from now on; existing pages fill up on the next rewrite
+    op.execute("ALTER TABLE tool SET (fillfactor = 80)")
+    op.execute("ALTER TABLE tool_execution SET (fillfactor = 80)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE tool_execution RESET (fillfactor)")
+    op.execute("ALTER TABLE tool RESET (fillfactor)")
@@ -0,0 +1,33 @@
+"""Store tool execution ids as native UUIDs and add a BRIN index on created_at
+
+Revision ID: 5f1d3b8e0a64
+Revises: 4e0c2a7d9f53
+Create Date: 2026-10-17 16:38:27.554081
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f1d3b8e0a64'
+down_revision: Union[str, None] = '4e0c2a7d9f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('tool_execution', 'execution_id', existing_type=sa.String(50), type_=sa.Uuid(),
+                    existing_nullable=False, postgresql_using='execution_id::uuid')
+    op.create_index('ix_toolexec_created_brin', 'tool_execution', ['created_at'], unique=False,
+                    postgresql_using='brin', postgresql_with={'pages_per_range': 32})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_toolexec_created_brin', table_name='tool_execution', postgresql_using='brin')
+    op.alter_column('tool_execution', 'execution_id', existing_type=sa.Uuid(), type_=sa.String(50),
+                    existing_nullable=False, postgresql_using='execution_id::text')
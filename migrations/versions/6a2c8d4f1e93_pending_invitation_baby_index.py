@@ -0,0 +1,34 @@
+"""Cover the baby in the pending co-parent invitation index
+
+Revision ID: 6a2c8d4f1e93
+Revises: 5f1d3b8e0a64
+Create Date: 2026-10-17 18:05:41.302917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a2c8d4f1e93'
+down_revision: Union[str, None] = '5f1d3b8e0a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (invitee_id, baby_id) still serves lookups by invitee alone and also
+    # answers the duplicate invitation check from the index
+    op.drop_index('ix_coparent_pending', table_name='coparent_invitation', postgresql_where=sa.text('status = 0'))
+    op.create_index('ix_coparent_pending', 'coparent_invitation', ['invitee_id', 'baby_id'], unique=False,
+                    postgresql_where=sa.text('status = 0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_coparent_pending', table_name='coparent_invitation', postgresql_where=sa.text('status = 0'))
+    op.create_index('ix_coparent_pending', 'coparent_invitation', ['invitee_id'], unique=False,
+                    postgresql_where=sa.text('status = 0'))
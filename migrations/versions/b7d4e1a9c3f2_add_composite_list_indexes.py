@@ -0,0 +1,36 @@
+"""Add composite indexes for per-baby and per-user list queries
+
+Revision ID: b7d4e1a9c3f2
+Revises: 51a3e2902444
+Create Date: 2026-10-17 10:12:41.218334
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d4e1a9c3f2'
+down_revision: Union[str, None] = '51a3e2902444'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_medication_baby_time', 'medication', ['baby_id', 'time_given'], unique=False)
+    op.create_index('ix_milestone_baby_achieved', 'milestone', ['baby_id', 'achieved_date'], unique=False)
+    op.create_index('ix_photo_baby_date', 'photo', ['baby_id', 'date_taken'], unique=False)
+    op.create_index('ix_pumping_user_start', 'pumping', ['user_id', 'start_time'], unique=False)
+    op.create_index('ix_notification_user_unread', 'notification', ['user_id', 'is_read'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notification_user_unread', table_name='notification')
+    op.drop_index('ix_pumping_user_start', table_name='pumping')
+    op.drop_index('ix_photo_baby_date', table_name='photo')
+    op.drop_index('ix_milestone_baby_achieved', table_name='milestone')
+    op.drop_index('ix_medication_baby_time', table_name='medication')
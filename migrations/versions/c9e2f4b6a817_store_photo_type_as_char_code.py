@@ -0,0 +1,50 @@
+"""Store photo.photo_type as a one character code
+
+Revision ID: c9e2f4b6a817
+Revises: b7d4e1a9c3f2
+Create Date: 2026-10-17 11:03:27.540918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e2f4b6a817'
+down_revision: Union[str, None] = 'b7d4e1a9c3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'photo', 'photo_type',
+        type_=sa.CHAR(1),
+        existing_nullable=False,
+        postgresql_using="CASE photo_type::text "
+                         "WHEN 'PROFILE' THEN 'P' "
+                         "WHEN 'MILESTONE' THEN 'M' "
+                         "WHEN 'GROWTH' THEN 'G' "
+                         "ELSE 'O' END"
+    )
+    op.execute("DROP TYPE IF EXISTS phototype")
+    op.create_check_constraint('ck_photo_photo_type', 'photo', "photo_type IN ('P', 'M', 'G', 'O')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ck_photo_photo_type', 'photo', type_='check')
+    op.execute("CREATE TYPE phototype AS ENUM ('PROFILE', 'MILESTONE', 'GROWTH', 'OTHER')")
+    op.alter_column(
+        'photo', 'photo_type',
+        type_=sa.Enum('PROFILE', 'MILESTONE', 'GROWTH', 'OTHER', name='phototype'),
+        existing_nullable=False,
+        postgresql_using="(CASE photo_type "
+                         "WHEN 'P' THEN 'PROFILE' "
+                         "WHEN 'M' THEN 'MILESTONE' "
+                         "WHEN 'G' THEN 'GROWTH' "
+                         "ELSE 'OTHER' END)::phototype"
+    )
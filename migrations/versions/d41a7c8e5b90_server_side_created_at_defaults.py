@@ -0,0 +1,38 @@
+"""Fill created_at on the database side
+
+Revision ID: d41a7c8e5b90
+Revises: c9e2f4b6a817
+Create Date: 2026-10-17 11:48:09.117402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a7c8e5b90'
+down_revision: Union[str, None] = 'c9e2f4b6a817'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('medication', 'milestone', 'photo', 'pumping', 'coparent_invitation', 'notification')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'created_at',
+                        existing_type=sa.DateTime(),
+                        existing_nullable=False,
+                        server_default=sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'created_at',
+                        existing_type=sa.DateTime(),
+                        existing_nullable=False,
+                        server_default=None)
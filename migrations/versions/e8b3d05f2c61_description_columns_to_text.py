@@ -0,0 +1,33 @@
+"""Store milestone and photo descriptions as TEXT
+
+Revision ID: e8b3d05f2c61
+Revises: d41a7c8e5b90
+Create Date: 2026-10-17 12:20:53.664210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3d05f2c61'
+down_revision: Union[str, None] = 'd41a7c8e5b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('milestone', 'description', existing_type=sa.String(500), type_=sa.Text(), existing_nullable=True)
+    op.alter_column('photo', 'description', existing_type=sa.String(500), type_=sa.Text(), existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Longer descriptions written since the upgrade are truncated to fit
+    op.alter_column('photo', 'description', existing_type=sa.Text(), type_=sa.String(500), existing_nullable=True,
+                    postgresql_using='left(description, 500)')
+    op.alter_column('milestone', 'description', existing_type=sa.Text(), type_=sa.String(500), existing_nullable=True,
+                    postgresql_using='left(description, 500)')
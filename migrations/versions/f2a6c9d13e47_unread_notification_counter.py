@@ -0,0 +1,65 @@
+"""Keep a per-user unread notification counter
+
+Revision ID: f2a6c9d13e47
+Revises: e8b3d05f2c61
+Create Date: 2026-10-17 12:51:36.402185
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6c9d13e47'
+down_revision: Union[str, None] = 'e8b3d05f2c61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('unread_notifications', sa.Integer(), nullable=False, server_default='0'))
+
+    op.execute("""
+        UPDATE users SET unread_notifications = counts.unread
+        FROM (
+            SELECT user_id, COUNT(*) AS unread
+            FROM notification
+            WHERE is_read IS NOT TRUE
+            GROUP BY user_id
+        ) AS counts
+        WHERE users.id = counts.user_id
+    """)
+
+    # Row triggers also see the bulk UPDATE/DELETE statements the services issue
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notification_unread_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                IF OLD.is_read IS NOT TRUE THEN
+                    UPDATE users SET unread_notifications = unread_notifications - 1 WHERE id = OLD.user_id;
+                END IF;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                IF NEW.is_read IS NOT TRUE THEN
+                    UPDATE users SET unread_notifications = unread_notifications + 1 WHERE id = NEW.user_id;
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER notification_unread_count
+        AFTER INSERT OR DELETE OR UPDATE OF is_read, user_id ON notification
+        FOR EACH ROW EXECUTE FUNCTION notification_unread_count()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS notification_unread_count ON notification")
+    op.execute("DROP FUNCTION IF EXISTS notification_unread_count()")
+    op.drop_column('users', 'unread_notifications')
@@ -0,0 +1,4 @@
+import os
+
+# The app creates its engine on import; tests replace it with their own in-memory database
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
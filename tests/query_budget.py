@@ -0,0 +1,74 @@
+"""
+Shared setup for tests that check endpoint statement counts against QUERY_BUDGETS.
+"""
+import unittest
+
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import create_app
+from app.main import Base, get_db
+from app.main.config import Config
+from app.main.model.baby import Baby
+from app.main.model.user import User
+from app.main.service.oauth_service import get_current_user
+from app.main.util.cache import invalidate_baby_cache
+from app.main.util.query_counter import QUERY_BUDGETS, QueryCountMiddleware, install_query_counter
+
+
+class QueryBudgetTestCase(unittest.TestCase):
+    """Runs the app against an in-memory database with one parent and their baby"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        install_query_counter(self.engine)
+        self.Session = sessionmaker(bind=self.engine, autoflush=False)
+
+        with self.Session() as db:
+            parent = User(email='parent@example.com', name='Parent', google_id='g-parent')
+            db.add(parent)
+            db.flush()
+            baby = Baby(fullname='Baby', sex='male', parent_id=parent.id)
+            db.add(baby)
+            db.commit()
+            self.parent_id, self.baby_id = parent.id, baby.id
+        invalidate_baby_cache(self.baby_id)
+        self.current_user_id = self.parent_id
+
+        def override_get_db():
+            db = self.Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        # Load the user in the request's session, as get_current_user does
+        def override_get_current_user(db: Session = Depends(get_db)):
+            return db.get(User, self.current_user_id)
+
+        app = create_app()
+        if not Config.SQLALCHEMY_COUNT_QUERIES:
+            app.add_middleware(QueryCountMiddleware)
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_current_user] = override_get_current_user
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def add_user(self, email, name):
+        """Create another user and return their id"""
+        with self.Session() as db:
+            user = User(email=email, name=name, google_id=f'g-{email}')
+            db.add(user)
+            db.commit()
+            return user.id
+
+    def assertWithinBudget(self, response, method, path):
+        budget = QUERY_BUDGETS[(method, path)]
+        count = int(response.headers['X-Query-Count'])
+        self.assertLessEqual(count, budget, f"{method} {path} ran {count} queries (budget {budget})")
@@ -0,0 +1,73 @@
+"""
+Statement counts of the co-parent endpoints, checked against QUERY_BUDGETS so
+that an N+1 brought back into the service fails here instead of only logging.
+"""
+from app.main.util.cache import invalidate_user_cache
+from tests.query_budget import QueryBudgetTestCase
+
+
+class CoParentQueryBudgetTest(QueryBudgetTestCase):
+    """Each co-parent endpoint stays within its statement budget"""
+
+    def setUp(self):
+        super().setUp()
+        self.invitee_id = self.add_user('invitee@example.com', 'Invitee')
+        invalidate_user_cache(self.invitee_id)
+
+    def invite(self):
+        response = self.client.post('/coparent/invite', json={'baby_id': self.baby_id, 'email': 'invitee@example.com'})
+        self.assertEqual(response.status_code, 200, response.text)
+        return response
+
+    def pending_invitation_id(self):
+        self.current_user_id = self.invitee_id
+        response = self.client.get('/coparent/invitations')
+        self.assertEqual(response.status_code, 200, response.text)
+        return response.json()[0]['invitation_id']
+
+    def test_invite(self):
+        self.assertWithinBudget(self.invite(), 'POST', '/coparent/invite')
+
+        duplicate = self.client.post('/coparent/invite', json={'baby_id': self.baby_id, 'email': 'invitee@example.com'})
+        self.assertEqual(duplicate.status_code, 400)
+
+    def test_pending_invitations(self):
+        self.invite()
+        self.current_user_id = self.invitee_id
+        response = self.client.get('/coparent/invitations')
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(len(response.json()), 1)
+        self.assertWithinBudget(response, 'GET', '/coparent/invitations')
+
+    def test_accept(self):
+        self.invite()
+        invitation_id = self.pending_invitation_id()
+        response = self.client.post(f'/coparent/invitations/{invitation_id}', json={'accept': True})
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertWithinBudget(response, 'POST', '/coparent/invitations/{invitation_id}')
+
+        again = self.client.post(f'/coparent/invitations/{invitation_id}', json={'accept': True})
+        self.assertEqual(again.status_code, 404)
+        self.assertEqual(self.client.get('/coparent/invitations').json(), [])
+
+    def test_decline(self):
+        self.invite()
+        invitation_id = self.pending_invitation_id()
+        response = self.client.post(f'/coparent/invitations/{invitation_id}', json={'accept': False})
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertWithinBudget(response, 'POST', '/coparent/invitations/{invitation_id}')
+
+    def test_remove(self):
+        self.invite()
+        invitation_id = self.pending_invitation_id()
+        self.client.post(f'/coparent/invitations/{invitation_id}', json={'accept': True})
+
+        self.current_user_id = self.parent_id
+        path = '/coparent/baby/{baby_id}/coparent/'
+        response = self.client.delete(path.format(baby_id=self.baby_id), params={'coparent': 'invitee@example.com'})
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertWithinBudget(response, 'DELETE', path)
+
+        again = self.client.delete(path.format(baby_id=self.baby_id), params={'coparent': 'invitee@example.com'})
+        self.assertEqual(again.status_code, 400)
+
@@ -0,0 +1,74 @@
+"""
+Statement counts of the per-baby list endpoints, checked against QUERY_BUDGETS
+with several records from more than one caregiver, so a per-record query fails here.
+"""
+from datetime import datetime, timedelta
+from unittest import mock
+
+from sqlalchemy import insert
+
+from app.main.model.medication import Medication
+from app.main.model.milestone import Milestone
+from app.main.model.parent_child_schema import baby_coparent
+from app.main.model.photo import Photo, PhotoType
+from tests.query_budget import QueryBudgetTestCase
+
+RECORD_COUNT = 5
+
+
+def fake_presigned_url(object_name, expiration=3600):
+    return f'https://bucket.example.com/{object_name}'
+
+
+class ListQueryBudgetTest(QueryBudgetTestCase):
+    """Each list endpoint stays within its statement budget regardless of the number of records"""
+
+    def setUp(self):
+        super().setUp()
+        coparent_id = self.add_user('coparent@example.com', 'Co-parent')
+        caregivers = [self.parent_id, coparent_id]
+        start = datetime(2025, 1, 1, 8, 0)
+
+        with self.Session() as db:
+            db.execute(insert(baby_coparent).values(baby_id=self.baby_id, user_id=coparent_id))
+            for i in range(RECORD_COUNT):
+                recorded_by = caregivers[i % 2]
+                db.add(Medication(name=f'Medication {i}', dosage=1.0, dosage_unit='ml', route='oral',
+                                  time_given=start + timedelta(hours=i), baby_id=self.baby_id,
+                                  recorded_by=recorded_by))
+                milestone = Milestone(title=f'Milestone {i}', category='motor',
+                                      achieved_date=start + timedelta(days=i), baby_id=self.baby_id,
+                                      recorded_by=recorded_by)
+                db.add(milestone)
+                db.flush()
+                db.add(Photo(photo_type=PhotoType.MILESTONE, s3_key=f'milestone-{i}.jpg', baby_id=self.baby_id,
+                             milestone_id=milestone.id, recorded_by=recorded_by))
+            db.commit()
+
+        for target in ('app.main.service.milestone_service.create_presigned_url',
+                       'app.main.service.photo_service.create_presigned_url'):
+            patcher = mock.patch(target, fake_presigned_url)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_list(self, path):
+        response = self.client.get(path.format(baby_id=self.baby_id))
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(len(response.json()), RECORD_COUNT)
+        self.assertWithinBudget(response, 'GET', path)
+        return response
+
+    def test_medications(self):
+        response = self.get_list('/medication/baby/{baby_id}')
+        self.assertEqual({m['caregiver_name'] for m in response.json()}, {'Parent', 'Co-parent'})
+
+    def test_milestones(self):
+        response = self.get_list('/milestone/baby/{baby_id}')
+        self.assertEqual({m['caregiver_name'] for m in response.json()}, {'Parent', 'Co-parent'})
+
+        # Filling in photo URLs must not write on a read
+        with self.Session() as db:
+            self.assertEqual(db.query(Milestone).filter(Milestone.photo_url.isnot(None)).count(), 0)
+
+    def test_photos(self):
+        self.get_list('/photos/baby/{baby_id}')